@@ -3,69 +3,161 @@
 Build and test script for the OpenAPI client generator.
 """
 
+import hashlib
 import subprocess
 import sys
 import os
-import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import argparse
-from pathlib import Path
 
 
-def run_command(cmd, description):
+# Fan tests out across all CPUs; --dist=loadgroup spreads tests across workers but keeps
+# each xdist_group (such as the spec loader test modules) on one worker.
+# Set PYTEST_XDIST_AUTO_NUM_WORKERS to cap the worker count picked by "-n auto".
+PYTEST_XDIST_ARGS = ["-n", "auto", "--dist=loadgroup", "--max-worker-restart=0"]
+
+# Persistent pip cache; cache it between CI runs to skip downloads.
+PIP_CACHE_DIR = Path(".pip-cache")
+# Install stamps live in the environment they describe, so a fresh or different
+# environment never sees a stamp recorded for another one.
+DEPS_STAMP = Path(sys.prefix) / ".openapi-client-deps-stamp"
+
+# Scratch working directory for the packaging tool, reused across builds.
+BUILD_WORKDIR = Path(".build-workdir")
+
+
+def env_with(**overrides):
+    """Return the process environment with the given variables overridden."""
+    return {**os.environ, **overrides}
+
+
+def env_without(name):
+    """Return the process environment without the given variable."""
+    # Share os.environ itself in the common case where the variable is not set
+    if name not in os.environ:
+        return os.environ
+    return {key: value for key, value in os.environ.items() if key != name}
+
+
+# Serializes output from stages that run in parallel
+OUTPUT_LOCK = threading.Lock()
+
+
+def write_output(lines):
+    """Write complete lines to stdout without interleaving with other stages."""
+    with OUTPUT_LOCK:
+        sys.stdout.write("".join(lines))
+        sys.stdout.flush()
+
+
+def run_command(cmd, description, env=None, cwd=None):
     """Run a command and handle errors."""
-    print(f"\n{'='*50}")
-    print(f"{description}")
-    print(f"{'='*50}")
-    print(f"Running: {' '.join(cmd)}")
-    
-    result = subprocess.run(cmd, capture_output=False)
-    if result.returncode != 0:
-        print(f"[ERROR] {description} failed!")
-        return False
+    # On GitHub Actions buffer each stage into one foldable group, since parallel
+    # stages would otherwise interleave inside the group markers
+    grouped = bool(os.environ.get("GITHUB_ACTIONS"))
+    prefix = f"[{description}] "
+    location = f" (cwd={cwd})" if cwd else ""
+    header = [
+        f"\n{'='*50}\n",
+        f"{description}\n",
+        f"{'='*50}\n",
+        f"Running: {' '.join(cmd)}{location}\n",
+    ]
+    buffered = [f"::group::{description}\n"] + header if grouped else []
+    if not grouped:
+        write_output(header)
+
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        bufsize=1,
+        env=env,
+        cwd=cwd,
+    ) as process:
+        for line in process.stdout:
+            if grouped:
+                buffered.append(line)
+            else:
+                write_output([prefix, line])
+        returncode = process.wait()
+
+    if grouped:
+        buffered.append("::endgroup::\n")
+    if returncode != 0:
+        buffered.append(f"[ERROR] {description} failed!\n")
     else:
-        print(f"[OK] {description} completed successfully!")
+        buffered.append(f"[OK] {description} completed successfully!\n")
+    write_output(buffered)
+    return returncode == 0
+
+
+def read_deps_stamps():
+    """Read the requirements hashes recorded by previous installs."""
+    if not DEPS_STAMP.exists():
+        return {}
+    stamps = {}
+    for line in DEPS_STAMP.read_text(encoding="utf-8").splitlines():
+        name, _, digest = line.partition("=")
+        stamps[name] = digest
+    return stamps
+
+
+def pip_install(requirements_file, description):
+    """Install a requirements file unless it is unchanged since the last install."""
+    digest = hashlib.sha256(Path(requirements_file).read_bytes()).hexdigest()
+    stamps = read_deps_stamps()
+    if stamps.get(requirements_file) == digest:
+        print(f"[OK] {description} skipped, {requirements_file} is unchanged")
         return True
 
+    cmd = [
+        sys.executable, "-m", "pip", "install",
+        "--cache-dir", str(PIP_CACHE_DIR),
+        "--prefer-binary",
+        "-r", requirements_file,
+    ]
+    if not run_command(cmd, description):
+        return False
+
+    stamps[requirements_file] = digest
+    try:
+        DEPS_STAMP.write_text(
+            "".join(f"{name}={value}\n" for name, value in sorted(stamps.items())),
+            encoding="utf-8",
+        )
+    except OSError:
+        # A read-only environment just reinstalls next time
+        pass
+    return True
+
 
 def install_deps():
     """Install dependencies."""
-    return run_command([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], 
-                      "Installing dependencies")
+    return pip_install("requirements.txt", "Installing dependencies")
 
 
 def install_dev_deps():
     """Install development dependencies."""
-    return run_command([sys.executable, "-m", "pip", "install", "-r", "requirements-dev.txt"], 
-                      "Installing development dependencies")
+    return pip_install("requirements-dev.txt", "Installing development dependencies")
 
 
 def run_tests():
     """Run the test suite."""
-    env = os.environ.copy()
     # Ensure tests import local package from src/
-    env["PYTHONPATH"] = str(Path.cwd() / "src")
-    print(f"\n{'='*50}")
-    print("Running tests")
-    print(f"{'='*50}")
-    cmd = [sys.executable, "-m", "pytest", "tests/", "-v"]
-    print(f"Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd, env=env)
-    if result.returncode != 0:
-        print(f"[ERROR] Running tests failed!")
-        return False
-    else:
-        print(f"[OK] Running tests completed successfully!")
-        return True
+    env = env_with(PYTHONPATH=str(Path.cwd() / "src"))
+    cmd = [sys.executable, "-m", "pytest", "tests/", "-v"] + PYTEST_XDIST_ARGS
+    return run_command(cmd, "Running tests", env=env)
 
 
 def run_tests_with_coverage():
     """Run tests with coverage."""
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(Path.cwd() / "src")
-    print(f"\n{'='*50}")
-    print("Running tests with coverage")
-    print(f"{'='*50}")
+    env = env_with(PYTHONPATH=str(Path.cwd() / "src"))
     cmd = [
         sys.executable,
         "-m",
@@ -74,15 +166,9 @@ def run_tests_with_coverage():
         "--cov=src",
         "--cov-report=html",
         "--cov-report=term",
-    ]
-    print(f"Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd, env=env)
-    if result.returncode != 0:
-        print(f"[ERROR] Running tests with coverage failed!")
-        return False
-    else:
-        print(f"[OK] Running tests with coverage completed successfully!")
-        return True
+        "--cov-context=test",
+    ] + PYTEST_XDIST_ARGS
+    return run_command(cmd, "Running tests with coverage", env=env)
 
 
 def lint_code():
@@ -103,33 +189,22 @@ def format_code():
 
 def type_check():
     """Run type checking."""
-    return run_command([sys.executable, "-m", "mypy", "src/"], 
+    # mypy is incremental through .mypy_cache (cached in CI), so repeated runs only
+    # re-check files that changed; no daemon is left running after the build
+    return run_command([sys.executable, "-m", "mypy", "src/"],
                       "Running type checking")
 
 
 def build_package():
     """Build the package."""
-    # Run the packaging tool from a temporary working directory and pass the
+    # Run the packaging tool from a separate working directory and pass the
     # project path to avoid importing this file as module 'build' (shadowing).
     project_path = Path.cwd()
-    print(f"\n{'='*50}")
-    print("Building package")
-    print(f"{'='*50}")
-
     cmd = [sys.executable, "-m", "build", str(project_path)]
-    print(f"Running: {' '.join(cmd)} (cwd=tempdir)")
+    env = env_without("PYTHONPATH")
 
-    env = os.environ.copy()
-    env.pop("PYTHONPATH", None)
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        result = subprocess.run(cmd, env=env, cwd=tmpdir)
-    if result.returncode != 0:
-        print(f"[ERROR] Building package failed!")
-        return False
-    else:
-        print(f"[OK] Building package completed successfully!")
-        return True
+    BUILD_WORKDIR.mkdir(exist_ok=True)
+    return run_command(cmd, "Building package", env=env, cwd=str(BUILD_WORKDIR))
 
 
 def test_generator():
@@ -142,6 +217,23 @@ def test_generator():
     ], "Testing generator with sample data")
 
 
+def run_parallel(*stages):
+    """Run independent stages concurrently and report whether all succeeded."""
+    # Split the CPUs between the stages so "-n auto" in a test stage does not
+    # oversubscribe the machine; an explicit setting from the caller wins
+    workers = max(1, (os.cpu_count() or 1) // len(stages))
+    previous = os.environ.get("PYTEST_XDIST_AUTO_NUM_WORKERS")
+    os.environ.setdefault("PYTEST_XDIST_AUTO_NUM_WORKERS", str(workers))
+    try:
+        # Each stage spends its time waiting on a child process, so threads are enough
+        with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            futures = [executor.submit(stage) for stage in stages]
+            return all([future.result() for future in futures])
+    finally:
+        if previous is None:
+            del os.environ["PYTEST_XDIST_AUTO_NUM_WORKERS"]
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Build and test script")
@@ -174,17 +266,15 @@ def main():
         success = True
         success &= install_deps()
         success &= install_dev_deps()
+        # Formatting rewrites files, so it must finish before the checks start
         success &= format_code()
-        success &= lint_code()
-        success &= type_check()
-        success &= run_tests_with_coverage()
+        success &= run_parallel(lint_code, type_check, run_tests_with_coverage)
+        # The sample client is written into the working tree, so generate it only
+        # after lint and the tests have finished reading the tree
         success &= test_generator()
         success &= build_package()
     elif args.command == "ci":
-        success = True
-        success &= lint_code()
-        success &= type_check()
-        success &= run_tests_with_coverage()
+        success = run_parallel(lint_code, type_check, run_tests_with_coverage)
         success &= test_generator()
     
     if success:
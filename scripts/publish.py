@@ -23,16 +23,14 @@ from typing import Dict, Optional
 
 def parse_env_file(path: Path) -> Dict[str, str]:
     data: Dict[str, str] = {}
-    with path.open() as f:
-        for raw in f:
-            line = raw.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            k, v = line.split("=", 1)
-            v = v.strip().strip('"').strip("'")
-            data[k.strip()] = v
+    for raw in path.read_text().splitlines():
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        k, sep, v = line.partition("=")
+        if not sep:
+            continue
+        data[k.strip()] = v.strip().strip('"').strip("'")
     return data
 
 
@@ -78,11 +76,12 @@ def main() -> int:
             return 4
 
     dist_dir = project_root / args.dist
-    if not dist_dir.exists() or not any(dist_dir.iterdir()):
+    entries = [p for p in dist_dir.iterdir() if p.is_file()] if dist_dir.is_dir() else []
+    if not entries:
         print(f"Error: no distribution files found in {dist_dir}. Run build first.")
         return 5
 
-    dists = sorted([str(p) for p in dist_dir.glob("*") if p.is_file()])
+    dists = sorted(map(str, entries))
     print("Distributions to upload:")
     for p in dists:
         print(" -", p)
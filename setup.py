@@ -20,6 +20,9 @@ setup(
     install_requires=[
         "requests>=2.0.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.0"],
+    },
     entry_points={
         "console_scripts": [
             "openapi-client-python=main:main",
@@ -23,11 +23,17 @@ def main() -> None:
     parser.add_argument(
         "--service-name", required=True, help="Service name for the generated client"
     )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for a regeneration cache; unchanged models are not rewritten",
+    )
 
     args = parser.parse_args()
 
     try:
-        generator = OpenAPIClientGenerator(args.spec, args.output, args.service_name)
+        generator = OpenAPIClientGenerator(
+            args.spec, args.output, args.service_name, args.cache_dir
+        )
         generator.generate_client()
         print("✅ Strongly-typed client generation completed successfully!")
     except Exception as e:
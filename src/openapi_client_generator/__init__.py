@@ -7,7 +7,7 @@ Generates strongly-typed Python clients from OpenAPI 3.0 or Swagger 2.0 specific
 from .generator import OpenAPIClientGenerator
 from .spec_loader import SpecLoader
 from .model_generator import ModelGenerator
-from .base_model import BaseModel
+from .base_model import BaseModel, FrozenBaseModel
 from .base_api_generator import BaseAPIGenerator
 from .swagger20_api_generator import Swagger20APIGenerator
 from .openapi30_api_generator import OpenAPI30APIGenerator
@@ -18,6 +18,7 @@ __all__ = [
     "SpecLoader",
     "ModelGenerator",
     "BaseModel",
+    "FrozenBaseModel",
     "BaseAPIGenerator",
     "Swagger20APIGenerator",
     "OpenAPI30APIGenerator",
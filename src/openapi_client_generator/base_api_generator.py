@@ -3,10 +3,73 @@ Base API generator with common functionality for both Swagger 2.0 and OpenAPI 3.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional, Tuple, cast
 from pathlib import Path
 from .utils import sanitize_model_name, to_snake_case, to_pascal_case, get_python_type
 
+# Parameter locations ("in"); string literals are interned, and str equality
+# checks identity first, so comparisons against these constants are cheap
+_IN_PATH = "path"
+_IN_QUERY = "query"
+_IN_HEADER = "header"
+_IN_COOKIE = "cookie"
+_IN_BODY = "body"
+
+# Code fragments emitted for every operation, filled in with str.format_map
+_METHOD_SIGNATURE_TMPL = "def {name}({params}) -> {return_type}:"
+_MODEL_IMPORT_TMPL = "from .{module} import {name}"
+# Parameter assignment, indexed by whether the parameter is required
+_ASSIGN_TMPLS = (
+    '        if {value} is not None:\n            {target}["{key}"] = {value}',
+    '        {target}["{key}"] = {value}',
+)
+
+# Request-and-return code for each kind of response, see _classify_response
+_RESPONSE_LINE = "        response = self._make_request({args})\n"
+_RETURN_TMPLS = {
+    "raw": "        return self._make_request({args})",
+    "list": _RESPONSE_LINE + "        return [{model}.from_dict(item) for item in response.json()]",
+    "json": _RESPONSE_LINE + "        return response.json()",
+    "text": _RESPONSE_LINE + "        return response.text",
+    "model": _RESPONSE_LINE + "        return {model}.from_dict(response.json())",
+}
+_RESPONSE_KINDS = {
+    "requests.Response": "raw",
+    "str": "text",
+    "int": "json",
+    "float": "json",
+    "bool": "json",
+    "Dict[str, Any]": "json",
+}
+
+
+def _classify_response(response_model: Optional[str]) -> Tuple[str, str]:
+    """Return the _RETURN_TMPLS kind and model name for a response type."""
+    if not response_model:
+        return "raw", ""
+    kind = _RESPONSE_KINDS.get(response_model)
+    if kind is not None:
+        return kind, ""
+    if response_model.startswith("List[") and response_model.endswith("]"):
+        return "list", response_model[5:-1]  # Remove 'List[' and ']'
+    return "model", response_model
+
+
+# Prefixes of local schema references in each specification version
+REF_PREFIX_OPENAPI3 = "#/components/schemas/"
+REF_PREFIX_SWAGGER2 = "#/definitions/"
+
+
+@lru_cache(maxsize=None)
+def ref_class_name(ref: str, prefix: str) -> Optional[str]:
+    """Return the model class name a $ref points to, or None if it is not under prefix."""
+    if not ref.startswith(prefix):
+        return None
+    # "#/components/schemas/pkg.Model" -> "Model"
+    model_name = ref.rpartition("/")[2]
+    return sanitize_model_name(model_name.rpartition(".")[2])
+
 
 class BaseAPIGenerator(ABC):
     """Base class for generating strongly-typed API client classes."""
@@ -19,6 +82,8 @@ class BaseAPIGenerator(ABC):
         self.schemas = schemas
         self.service_name = service_name
         self.output_dir = output_dir
+        # Operations extracted from paths, filled in on first use
+        self._operations: Optional[List[Dict[str, Any]]] = None
 
     def generate_api_client(self) -> None:
         """Generate the main API client class."""
@@ -30,31 +95,33 @@ class BaseAPIGenerator(ABC):
 
         content = self._generate_apis_content(class_name, operations)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        file_path.write_bytes(content.encode("utf-8"))
 
     def _extract_operations(self) -> List[Dict[str, Any]]:
-        """Extract API operations from the specification."""
-        operations = []
+        """Extract API operations from the specification.
 
+        The paths are walked once per generator; later calls return the same list.
+        """
+        if self._operations is None:
+            self._operations = list(self._iter_operations())
+        return self._operations
+
+    def _iter_operations(self) -> Iterator[Dict[str, Any]]:
+        """Yield the API operations defined in the specification paths."""
         for path, path_item in self.paths.items():
             for method, operation in path_item.items():
                 if method.upper() in ["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"]:
-                    operations.append(
-                        {
-                            "path": path,
-                            "method": method.upper(),
-                            "operation_id": operation.get(
-                                "operationId", f"{method}_{path.replace('/', '_')}"
-                            ),
-                            "parameters": operation.get("parameters", []),
-                            "operation": operation,
-                            "summary": operation.get("summary", ""),
-                            "description": operation.get("description", ""),
-                        }
-                    )
-
-        return operations
+                    yield {
+                        "path": path,
+                        "method": method.upper(),
+                        "operation_id": operation.get(
+                            "operationId", f"{method}_{path.replace('/', '_')}"
+                        ),
+                        "parameters": operation.get("parameters", []),
+                        "operation": operation,
+                        "summary": operation.get("summary", ""),
+                        "description": operation.get("description", ""),
+                    }
 
     @abstractmethod
     def _get_request_body_info(self, operation: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -73,24 +140,24 @@ class BaseAPIGenerator(ABC):
 
     def _generate_apis_content(self, class_name: str, operations: List[Dict[str, Any]]) -> str:
         """Generate the complete API client class content."""
-        imports = self._generate_imports()
-        class_definition = self._generate_class_definition(class_name)
-        init_method = self._generate_init_method()
-        utility_methods = self._generate_utility_methods()
-        api_methods = []
-
-        for operation in operations:
-            api_methods.append(self._generate_api_method(operation))
-
-        content = f"""{imports}
-
-{class_definition}
-{init_method}
-{utility_methods}
-
-{chr(10).join(api_methods)}"""
-
-        return content
+        parts = [
+            self._generate_imports(),
+            "\n\n",
+            self._generate_class_definition(class_name),
+            "\n",
+            self._generate_init_method(),
+            "\n",
+            self._generate_utility_methods(),
+            "\n\n",
+        ]
+
+        # Methods are separated by a newline; the whole file is joined once
+        for index, operation in enumerate(operations):
+            if index:
+                parts.append("\n")
+            parts.append(self._generate_api_method(operation))
+
+        return "".join(parts)
 
     def _generate_imports(self) -> str:
         """Generate import statements."""
@@ -108,26 +175,13 @@ from typing import Optional, Dict, Any, Union, List"""
         if not self.schemas:
             return ""
 
+        # Sorted so the generated module is stable regardless of schema order.
+        # Import path is .models.hierarchy.folder.ClassName, each part sanitized
         imports = []
-        for model_name in self.schemas.keys():
-            parts = model_name.split(".")
-
-            if len(parts) >= 2:
-                # New structure: last is class, second-to-last is folder, rest is hierarchy
-                class_name = sanitize_model_name(parts[-1])
-                folder_name = sanitize_model_name(parts[-2])
-                hierarchy_parts = (
-                    [sanitize_model_name(p) for p in parts[:-2]] if len(parts) > 2 else []
-                )
-
-                # Build import path: .models.hierarchy.folder.ClassName
-                path_parts = ["models"] + hierarchy_parts + [folder_name, class_name]
-                import_path = ".".join(path_parts)
-                imports.append(f"from .{import_path} import {class_name}")
-            else:
-                # Single part - direct in models/
-                class_name = sanitize_model_name(model_name)
-                imports.append(f"from .models.{class_name} import {class_name}")
+        for model_name in sorted(self.schemas):
+            parts = [sanitize_model_name(part) for part in model_name.split(".")]
+            module = ".".join(["models", *parts])
+            imports.append(_MODEL_IMPORT_TMPL.format_map({"module": module, "name": parts[-1]}))
 
         return "\n".join(imports)
 
@@ -257,10 +311,21 @@ from typing import Optional, Dict, Any, Union, List"""
         operation_data = operation["operation"]
 
         # Extract different parameter types
-        path_params = [p for p in parameters if p.get("in") == "path"]
-        query_params = [p for p in parameters if p.get("in") == "query"]
-        header_params = [p for p in parameters if p.get("in") == "header"]
-        cookie_params = [p for p in parameters if p.get("in") == "cookie"]
+        # Bucket the parameters by location in one pass; other locations are ignored
+        buckets: Dict[str, List[Dict[str, Any]]] = {
+            _IN_PATH: [],
+            _IN_QUERY: [],
+            _IN_HEADER: [],
+            _IN_COOKIE: [],
+        }
+        for param in parameters:
+            bucket = buckets.get(param.get("in"))
+            if bucket is not None:
+                bucket.append(param)
+        path_params = buckets[_IN_PATH]
+        query_params = buckets[_IN_QUERY]
+        header_params = buckets[_IN_HEADER]
+        cookie_params = buckets[_IN_COOKIE]
 
         # Get request body information
         request_body_info = self._get_request_body_info(operation_data)
@@ -319,7 +384,9 @@ from typing import Optional, Dict, Any, Union, List"""
         # Determine return type
         return_type = response_model if response_model else "requests.Response"
 
-        signature = f"def {method_name}({', '.join(signature_parts)}) -> {return_type}:"
+        signature = _METHOD_SIGNATURE_TMPL.format_map(
+            {"name": method_name, "params": ", ".join(signature_parts), "return_type": return_type}
+        )
 
         # Generate method body
         operation_summary = operation_data.get(
@@ -345,12 +412,12 @@ from typing import Optional, Dict, Any, Union, List"""
             for param in query_params:
                 param_name = to_snake_case(param["name"])
                 original_name = param["name"]
-                required = param.get("required", False)
-                if required:
-                    body_lines.append(f'        params["{original_name}"] = {param_name}')
-                else:
-                    body_lines.append(f"        if {param_name} is not None:")
-                    body_lines.append(f'            params["{original_name}"] = {param_name}')
+                template = _ASSIGN_TMPLS[bool(param.get("required", False))]
+                body_lines.append(
+                    template.format_map(
+                        {"target": "params", "key": original_name, "value": param_name}
+                    )
+                )
 
         # Generate headers handling
         headers_lines = []
@@ -359,12 +426,12 @@ from typing import Optional, Dict, Any, Union, List"""
             for param in header_params:
                 param_name = to_snake_case(param["name"])
                 original_name = param["name"]
-                required = param.get("required", False)
-                if required:
-                    headers_lines.append(f'        headers["{original_name}"] = {param_name}')
-                else:
-                    headers_lines.append(f"        if {param_name} is not None:")
-                    headers_lines.append(f'            headers["{original_name}"] = {param_name}')
+                template = _ASSIGN_TMPLS[bool(param.get("required", False))]
+                headers_lines.append(
+                    template.format_map(
+                        {"target": "headers", "key": original_name, "value": param_name}
+                    )
+                )
 
         # Generate cookies handling
         cookies_lines = []
@@ -373,12 +440,12 @@ from typing import Optional, Dict, Any, Union, List"""
             for param in cookie_params:
                 param_name = to_snake_case(param["name"])
                 original_name = param["name"]
-                required = param.get("required", False)
-                if required:
-                    cookies_lines.append(f'        cookies["{original_name}"] = {param_name}')
-                else:
-                    cookies_lines.append(f"        if {param_name} is not None:")
-                    cookies_lines.append(f'            cookies["{original_name}"] = {param_name}')
+                template = _ASSIGN_TMPLS[bool(param.get("required", False))]
+                cookies_lines.append(
+                    template.format_map(
+                        {"target": "cookies", "key": original_name, "value": param_name}
+                    )
+                )
 
         # Add generated lines to body
         body_lines.extend(headers_lines)
@@ -398,57 +465,26 @@ from typing import Optional, Dict, Any, Union, List"""
             request_args.append("cookies=cookies if cookies else None")
         if request_body_info:
             if request_body_info.get("is_json", True):
-                # Handle model serialization - convert to dict if it has to_dict method
-                body_lines.append("        # Serialize payload if it's a model object")
-                to_dict_check = (
-                    "        json_payload = payload.to_dict() "
-                    "if hasattr(payload, 'to_dict') else payload"
+                # Models are sent as pre-encoded JSON bytes so requests skips its own
+                # encode; the client headers already carry the JSON content type
+                body_lines.append("        # Send models as encoded JSON bytes, others via json=")
+                body_select = (
+                    '        body = {"data": bytes(payload)} '
+                    'if hasattr(payload, "to_json_bytes") else {"json": payload}'
                 )
-                body_lines.append(to_dict_check)
-                request_args.append("json=json_payload")
+                body_lines.append(body_select)
+                request_args.append("**body")
             else:
                 request_args.append("data=payload")
 
-        # Generate return logic with strong typing
-        if response_model and response_model != "requests.Response":
-            # Strong typed response - convert response to model
-            body_lines.append(f"        response = self._make_request({', '.join(request_args)})")
-
-            if response_model.startswith("List[") and response_model.endswith("]"):
-                # Handle array responses
-                model_name = response_model[5:-1]  # Remove 'List[' and ']'
-                body_lines.append(
-                    f"        return [{model_name}.from_dict(item) for item in response.json()]"
-                )
-            elif response_model in [
-                "str",
-                "int",
-                "float",
-                "bool",
-                "Dict[str, Any]",
-            ]:
-                # Handle primitive types and Dict - return JSON directly
-                if response_model == "str":
-                    body_lines.append("        return response.text")
-                elif response_model == "Dict[str, Any]":
-                    body_lines.append("        return response.json()")
-                else:
-                    body_lines.append("        return response.json()")
-            else:
-                # Handle single model responses
-                body_lines.append(
-                    "        return " + response_model + ".from_dict(response.json())"
-                )
-        else:
-            # Raw response
-            return_line = f"        return self._make_request({', '.join(request_args)})"
-            body_lines.append(return_line)
-
-        method_body = "\n".join(body_lines)
+        # Generate request call and return logic with strong typing
+        kind, model_name = _classify_response(response_model)
+        body_lines.append(
+            _RETURN_TMPLS[kind].format_map({"args": ", ".join(request_args), "model": model_name})
+        )
 
-        return f"""
-    {signature}
-{method_body}"""
+        # A leading blank line separates the method from the previous one
+        return "\n".join(["", f"    {signature}", *body_lines])
 
     def _get_parameter_type(self, param: Dict[str, Any]) -> str:
         """Get the Python type for a parameter."""
@@ -465,9 +501,17 @@ from typing import Optional, Dict, Any, Union, List"""
 
         return get_python_type(param_type, param_format)
 
+    def _find_success_response(self, operation: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the first successful (2xx) response of an operation, if any."""
+        for status_code, response in operation.get("responses", {}).items():
+            # Status codes are strings in parsed specs, but integers are accepted too
+            if isinstance(status_code, str):
+                if status_code.startswith("2"):
+                    return cast(Dict[str, Any], response)
+            elif isinstance(status_code, int) and 200 <= status_code < 300:
+                return cast(Dict[str, Any], response)
+        return None
+
     def _find_body_parameter(self, parameters: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """Find the body parameter in the parameters list (for Swagger 2.0)."""
-        for param in parameters:
-            if param.get("in") == "body":
-                return param
-        return None
+        return next((param for param in parameters if param.get("in") == _IN_BODY), None)
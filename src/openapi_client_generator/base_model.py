@@ -2,39 +2,118 @@
 Base model class for all generated models.
 """
 
+import importlib
 import json
-from typing import Dict, Any, TypeVar, Type, Optional
+from types import MappingProxyType
+from typing import Dict, Any, TypeVar, Type, Optional, ClassVar, Union, List, Mapping, cast
+
+try:
+    # Optional C-accelerated JSON backend (pip install openapi-client-python[fast])
+    _orjson: Any = importlib.import_module("orjson")
+except ImportError:
+    _orjson = None
 
 
 T = TypeVar("T", bound="BaseModel")
 
+if _orjson is not None:
+    _ORJSON_OPTIONS = _orjson.OPT_NON_STR_KEYS
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        return cast(bytes, _orjson.dumps(obj, default=_encode_model, option=_ORJSON_OPTIONS))
+
+    def _dumps(obj: Any) -> str:
+        return _dumps_bytes(obj).decode("utf-8")
+
+    def _loads(raw: Union[str, bytes]) -> Any:
+        return _orjson.loads(raw)
+
+else:
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        return _dumps(obj).encode("utf-8")
+
+    def _dumps(obj: Any) -> str:
+        # Compact separators and raw UTF-8 keep the payload small, matching orjson
+        return json.dumps(obj, default=_encode_model, separators=(",", ":"), ensure_ascii=False)
+
+    def _loads(raw: Union[str, bytes]) -> Any:
+        return json.loads(raw)
+
 
 class BaseModel:
     """Base class for all generated model classes with common serialization methods."""
 
-    def __init__(self, data: Optional[Dict[str, Any]] = None):
+    __slots__ = ("_data", "_has_nested", "_json_cache")
+
+    # Opt-in memoization of to_json() for models that are not mutated after
+    # construction. Call invalidate() after changing _data on a caching instance.
+    cache_serialization: ClassVar[bool] = False
+
+    _data: Mapping[str, Any]
+
+    def __init__(self, data: Optional[Mapping[str, Any]] = None):
         """Initialize the model with optional data dictionary."""
-        self._data = data or {}
+        self._data = data if data is not None else {}
+        self._json_cache: Optional[str] = None
+        # Only caching models trust this flag; other models may be mutated later
+        self._has_nested = self.cache_serialization and self._scan_nested()
+
+    def _scan_nested(self) -> bool:
+        """Check whether any value needs conversion in to_dict()."""
+        return any(isinstance(value, (BaseModel, list)) for value in self._data.values())
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary with nested object support."""
-        result = {}
-        for key, value in self._data.items():
-            if hasattr(value, "to_dict"):
-                # Handle nested model objects
-                result[key] = value.to_dict()
-            elif isinstance(value, list):
-                # Handle lists that might contain model objects
-                result[key] = [
-                    item.to_dict() if hasattr(item, "to_dict") else item for item in value
-                ]
-            else:
-                result[key] = value
+        result = dict(self._data)
+        if self.cache_serialization and not self._has_nested:
+            # Flat data of primitives only needs a shallow copy
+            return result
+
+        # Convert nested values in place in the shallow copies, walking nested models
+        # with an explicit stack so deep trees cannot hit the recursion limit and no
+        # Python frame is set up per level. Flat data costs one pass over the copy.
+        _isinstance = isinstance
+        _BaseModel = BaseModel
+        stack: List[Dict[str, Any]] = [result]
+        while stack:
+            target = stack.pop()
+            for key, value in target.items():
+                if _isinstance(value, _BaseModel):
+                    # Handle nested model objects
+                    target[key] = _convert_model(value, stack)
+                elif _isinstance(value, list):
+                    # Handle lists that might contain model objects
+                    target[key] = [
+                        _convert_model(item, stack) if _isinstance(item, _BaseModel) else item
+                        for item in value
+                    ]
+
         return result
 
     def to_json(self) -> str:
         """Convert model to JSON string."""
-        return json.dumps(self.to_dict())
+        if self._json_cache is not None:
+            return self._json_cache
+
+        # The encoder walks nested models itself, so no intermediate dict is built
+        result = _dumps(self._data)
+        if self.cache_serialization:
+            self._json_cache = result
+        return result
+
+    def to_json_bytes(self) -> bytes:
+        """Convert model to UTF-8 encoded JSON, ready to use as an HTTP body."""
+        return _dumps_bytes(self._data)
+
+    def __bytes__(self) -> bytes:
+        """Encode the model as a JSON request body; _data must be JSON-serializable."""
+        return self.to_json_bytes()
+
+    def invalidate(self) -> None:
+        """Drop memoized results; call after changing _data on a caching model."""
+        self._json_cache = None
+        self._has_nested = self.cache_serialization and self._scan_nested()
 
     @classmethod
     def from_dict(cls: Type[T], data: Dict[str, Any]) -> T:
@@ -44,4 +123,45 @@ class BaseModel:
     @classmethod
     def from_json(cls: Type[T], json_str: str) -> T:
         """Create model from JSON string."""
-        return cls(json.loads(json_str))
+        return cls(_loads(json_str))
+
+    @classmethod
+    def from_json_bytes(cls: Type[T], raw: bytes) -> T:
+        """Create model from UTF-8 encoded JSON, such as a raw HTTP response body."""
+        return cls(_loads(raw))
+
+
+class FrozenBaseModel(BaseModel):
+    """Read-only model whose data can be shared safely across threads and requests.
+
+    The data is copied on construction and exposed through a read-only mapping,
+    so its JSON is always memoized. to_dict() returns a new dict on every call.
+    Nested models are not frozen.
+    """
+
+    __slots__ = ()
+
+    cache_serialization = True
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        """Initialize the model with a read-only copy of the data dictionary."""
+        super().__init__(MappingProxyType(dict(data or {})))
+
+
+def _convert_model(model: BaseModel, stack: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return a copy of a nested model's data, queueing it on the to_dict() stack if needed."""
+    converted = dict(model._data)
+    if model.cache_serialization and not model._has_nested:
+        return converted
+    stack.append(converted)
+    return converted
+
+
+def _encode_model(obj: Any) -> Any:
+    """JSON encoder hook that serializes nested models through their data."""
+    if isinstance(obj, BaseModel):
+        return obj._data
+    if isinstance(obj, MappingProxyType):
+        # Data of frozen models
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
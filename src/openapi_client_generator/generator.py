@@ -3,6 +3,7 @@ Main OpenAPI client generator orchestrator.
 """
 
 from pathlib import Path
+from typing import Optional
 from .spec_loader import SpecLoader
 from .model_generator import ModelGenerator
 from .swagger20_api_generator import Swagger20APIGenerator
@@ -13,11 +14,19 @@ from .base_api_generator import BaseAPIGenerator
 class OpenAPIClientGenerator:
     """Generator for strongly-typed Python clients from OpenAPI/Swagger specs."""
 
-    def __init__(self, spec_file: str, output_dir: str, service_name: str) -> None:
+    def __init__(
+        self,
+        spec_file: str,
+        output_dir: str,
+        service_name: str,
+        cache_dir: Optional[str] = None,
+    ) -> None:
         """Initialize the generator."""
         self.spec_file = spec_file
         self.output_dir = Path(output_dir)
         self.service_name = service_name
+        # Optional regeneration cache, kept outside the generated package
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
         # Load and parse specification
         self.spec_loader = SpecLoader(spec_file)
@@ -68,7 +77,7 @@ class OpenAPIClientGenerator:
         # Generate models
         schemas = self.spec_loader.get_schemas()
         if schemas:
-            model_generator = ModelGenerator(schemas, self.service_dir)
+            model_generator = ModelGenerator(schemas, self.service_dir, self.cache_dir)
             model_generator.generate_models()
 
         # Generate API client using version-specific generator
@@ -105,5 +114,4 @@ __version__ = '1.0.0'
 '''
 
         init_file = self.service_dir / "__init__.py"
-        with open(init_file, "w", encoding="utf-8") as f:
-            f.write(init_content)
+        init_file.write_bytes(init_content.encode("utf-8"))
@@ -2,38 +2,192 @@
 Model generator for OpenAPI/Swagger specifications.
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+import hashlib
+import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
+from . import utils
 from .utils import sanitize_model_name, sanitize_python_identifier, to_snake_case, get_python_type
 
+# Imports shared by every generated model and enum module
+_MODEL_IMPORT_HEADER = (
+    "from __future__ import annotations\n\nfrom typing import List, Union, Optional, Dict, Any"
+)
+
+# Number of threads used to render and write model files; file writes release the GIL.
+_WRITE_WORKERS = 8
+
+
+# Prefix of the per-output schema cache files kept in the optional cache directory
+SCHEMA_CACHE_PREFIX = "schema-cache-"
+
+
+@lru_cache(maxsize=None)
+def _generator_digest() -> str:
+    """Digest of the code that renders models, so cached files are redone when it changes."""
+    digest = hashlib.blake2b(digest_size=16)
+    for source in (__file__, utils.__file__):
+        digest.update(Path(source).read_bytes())
+    return digest.hexdigest()
+
+
+def _schema_digest(model_name: str, model_def: Dict[str, Any]) -> str:
+    """Return a digest identifying the rendered content of one model."""
+    payload = json.dumps([_generator_digest(), model_name, model_def], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _content_digest(raw: bytes) -> str:
+    """Return a digest of a generated file's bytes."""
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _write_file(path_and_content: Tuple[Path, str]) -> None:
+    """Write one generated file."""
+    path, content = path_and_content
+    # Encode up front and write bytes, skipping the text I/O wrapper
+    path.write_bytes(content.encode("utf-8"))
+
+
+@lru_cache(maxsize=None)
+def _compute_import_path(model_name: str, current_namespace: Tuple[str, ...]) -> Tuple[str, str]:
+    """Compute the relative import path and class name of a model.
+
+    Calculate relative import based on the current namespace and target namespace.
+    With new structure: hierarchy.folder.ClassName
+    """
+    parts = model_name.split(".")
+
+    if len(parts) >= 2:
+        # Target: last part is class, second-to-last is folder, rest is hierarchy
+        class_name = sanitize_model_name(parts[-1])
+        folder_name = sanitize_model_name(parts[-2])
+        hierarchy_parts = [sanitize_model_name(p) for p in parts[:-2]] if len(parts) > 2 else []
+
+        # Target namespace includes hierarchy + folder
+        target_namespace = hierarchy_parts + [folder_name]
+    else:
+        # Target has no namespace (root level)
+        target_namespace = []
+        class_name = sanitize_model_name(model_name)
+
+    # Find common prefix
+    common_len = 0
+    for i in range(min(len(current_namespace), len(target_namespace))):
+        if current_namespace[i] == target_namespace[i]:
+            common_len += 1
+        else:
+            break
+
+    # Calculate how many levels to go up
+    up_levels = len(current_namespace) - common_len
+
+    # Calculate path from common ancestor to target
+    down_path = target_namespace[common_len:]
+
+    # Build import path
+    if up_levels == 0 and len(down_path) == 0:
+        # Same directory
+        import_path = f".{class_name}"
+    else:
+        # Need to navigate
+        dots = "." * (up_levels + 1)
+        if down_path:
+            import_path = f"{dots}{'.'.join(down_path)}.{class_name}"
+        else:
+            import_path = f"{dots}{class_name}"
+
+    return import_path, class_name
+
 
 class ModelGenerator:
     """Generates strongly-typed model classes from schema definitions."""
 
-    def __init__(self, schemas: Dict[str, Any], output_dir: Path) -> None:
-        """Initialize the model generator."""
+    def __init__(
+        self, schemas: Dict[str, Any], output_dir: Path, cache_dir: Optional[Path] = None
+    ) -> None:
+        """Initialize the model generator.
+
+        With a cache_dir, model files whose schema is unchanged since the last run
+        and whose content still matches what was written are not rendered again.
+        """
         self.schemas = schemas
         self.output_dir = output_dir
         self.models_dir = output_dir / "models"
         self.base_dir = output_dir / "base"
+        self.cache_dir = cache_dir
 
     def generate_models(self) -> None:
         """Generate all model classes."""
-        # Create required directories
-        self.models_dir.mkdir(parents=True, exist_ok=True)
+        # Create every required directory once up front, rather than once per model
+        model_dirs = {self._compute_model_dir(model_name) for model_name in self.schemas}
+        model_dirs.add(self.models_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        for model_dir in sorted(model_dirs):
+            model_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate base model
-        self._generate_base_model()
-
-        # Generate each model
-        for model_name, model_def in self.schemas.items():
-            self._generate_model_class(model_name, model_def)
-
-        # Generate models __init__.py
-        self._generate_models_init()
-
-    def _generate_base_model(self) -> None:
+        # With a cache, skip models whose schema and generated file are both unchanged
+        cache_path = self._schema_cache_path()
+        previous = self._load_schema_cache(cache_path) if cache_path is not None else {}
+        entries: Dict[str, List[str]] = {}
+
+        # Rendering is CPU-bound and holds the GIL, so models are rendered here and each
+        # file is handed to the pool as soon as it is ready; writes overlap rendering
+        with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as executor:
+            files = self._generate_base_model() + self._generate_models_init()
+            tasks = [executor.submit(_write_file, file) for file in files]
+            for model_name, model_def in self.schemas.items():
+                if cache_path is not None:
+                    digest = _schema_digest(model_name, model_def)
+                    entry = previous.get(model_name)
+                    if entry and entry[0] == digest and self._is_unmodified(model_name, entry[1]):
+                        entries[model_name] = entry
+                        continue
+                model_file = self._generate_model_class(model_name, model_def)
+                if cache_path is not None:
+                    entries[model_name] = [digest, _content_digest(model_file[1].encode("utf-8"))]
+                tasks.append(executor.submit(_write_file, model_file))
+            for task in tasks:
+                task.result()
+
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(entries, indent=2, sort_keys=True), encoding="utf-8")
+
+    def _schema_cache_path(self) -> Optional[Path]:
+        """Return the schema cache file for this output directory, if caching is enabled."""
+        if self.cache_dir is None:
+            return None
+        # One cache file per models directory, so a cache dir can serve several outputs
+        key = hashlib.blake2b(str(self.models_dir.resolve()).encode("utf-8"), digest_size=8)
+        return self.cache_dir / f"{SCHEMA_CACHE_PREFIX}{key.hexdigest()}.json"
+
+    def _load_schema_cache(self, cache_path: Path) -> Dict[str, List[str]]:
+        """Load the schema and content digests of the previous run, or nothing if unavailable."""
+        try:
+            cache = json.loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        return {
+            name: entry
+            for name, entry in cache.items()
+            if isinstance(entry, list) and len(entry) == 2
+        }
+
+    def _is_unmodified(self, model_name: str, content_digest: str) -> bool:
+        """Check whether a model file still holds exactly what was last written to it."""
+        try:
+            raw = self._compute_model_file(model_name).read_bytes()
+        except OSError:
+            return False
+        return _content_digest(raw) == content_digest
+
+    def _generate_base_model(self) -> List[Tuple[Path, str]]:
         """Generate the base model class that all models inherit from."""
         base_model_content = '''"""
 Base model class for all generated models.
@@ -49,21 +203,25 @@ T = TypeVar('T', bound='BaseModel')
 class BaseModel:
     """Base class for all generated model classes with common serialization methods."""
 
+    __slots__ = ("_data",)
+
     def __init__(self, data: Dict[str, Any] | None = None):
         """Initialize the model with optional data dictionary."""
         self._data = data or {}
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary with nested object support."""
+        # Bind the class lookups once for the loop below
+        model_type = BaseModel
         result = {}
         for key, value in self._data.items():
-            if hasattr(value, 'to_dict'):
+            if isinstance(value, model_type):
                 # Handle nested model objects
                 result[key] = value.to_dict()
             elif isinstance(value, list):
                 # Handle lists that might contain model objects
                 result[key] = [
-                    item.to_dict() if hasattr(item, "to_dict") else item for item in value
+                    item.to_dict() if isinstance(item, model_type) else item for item in value
                 ]
             else:
                 result[key] = value
@@ -71,7 +229,15 @@ class BaseModel:
 
     def to_json(self) -> str:
         """Convert model to JSON string."""
-        return json.dumps(self.to_dict())
+        return json.dumps(self.to_dict(), separators=(",", ":"), ensure_ascii=False)
+
+    def to_json_bytes(self) -> bytes:
+        """Convert model to UTF-8 encoded JSON, ready to use as an HTTP body."""
+        return self.to_json().encode("utf-8")
+
+    def __bytes__(self) -> bytes:
+        """Encode the model as a JSON request body; _data must be JSON-serializable."""
+        return self.to_json_bytes()
 
     @classmethod
     def from_dict(cls: Type[T], data: Dict[str, Any]) -> T:
@@ -81,25 +247,39 @@ class BaseModel:
     @classmethod
     def from_json(cls: Type[T], json_str: str) -> T:
         """Create model from JSON string."""
-        return cls(json.loads(json_str))
+        return cls.from_dict(json.loads(json_str))
 '''
-        # Write base model
-        base_model_path = self.base_dir / "base_model.py"
-        with open(base_model_path, "w", encoding="utf-8") as f:
-            f.write(base_model_content)
-
-        # Create __init__.py for base package
-        init_path = self.base_dir / "__init__.py"
-        with open(init_path, "w", encoding="utf-8") as f:
-            init_content = (
-                '"""Base package for generated models."""\n\n'
-                "from .base_model import BaseModel\n\n"
-                '__all__ = ["BaseModel"]\n'
-            )
-            f.write(init_content)
+        # Base model and __init__.py for the base package
+        init_content = (
+            '"""Base package for generated models."""\n\n'
+            "from .base_model import BaseModel\n\n"
+            '__all__ = ["BaseModel"]\n'
+        )
+        return [
+            (self.base_dir / "base_model.py", base_model_content),
+            (self.base_dir / "__init__.py", init_content),
+        ]
 
-    def _generate_model_class(self, model_name: str, model_def: Dict[str, Any]) -> None:
-        """Generate a single strongly-typed model class."""
+    def _compute_model_dir(self, model_name: str) -> Path:
+        """Return the directory a model's file is generated into."""
+        parts = model_name.split(".")
+        if len(parts) < 2:
+            # Single part - models root
+            return self.models_dir
+
+        # Build directory path: models/ + hierarchy + folder
+        model_dir = self.models_dir
+        for part in parts[:-1]:
+            model_dir = model_dir / sanitize_model_name(part)
+        return model_dir
+
+    def _compute_model_file(self, model_name: str) -> Path:
+        """Return the path of the file a model is generated into."""
+        class_name = sanitize_model_name(model_name.split(".")[-1])
+        return self._compute_model_dir(model_name) / f"{class_name}.py"
+
+    def _generate_model_class(self, model_name: str, model_def: Dict[str, Any]) -> Tuple[Path, str]:
+        """Render a single strongly-typed model class."""
         parts = model_name.split(".")
 
         if len(parts) >= 2:
@@ -110,21 +290,15 @@ class BaseModel:
             # Everything before the last two parts is the hierarchy
             hierarchy_parts = parts[:-2] if len(parts) > 2 else []
 
-            # Build directory path: models/ + hierarchy + folder
-            model_dir = self.models_dir
-            for part in hierarchy_parts:
-                model_dir = model_dir / sanitize_model_name(part)
-            model_dir = model_dir / folder_name
-
-            model_dir.mkdir(parents=True, exist_ok=True)
-            file_path = model_dir / f"{class_name}.py"
+            # The directory itself is created by generate_models
+            file_path = self._compute_model_file(model_name)
 
             # Current namespace for imports includes hierarchy + folder
             current_namespace = [sanitize_model_name(p) for p in hierarchy_parts] + [folder_name]
         else:
             # Single part - just use as class name in models root
             class_name = sanitize_model_name(model_name)
-            file_path = self.models_dir / f"{class_name}.py"
+            file_path = self._compute_model_file(model_name)
             current_namespace = []
 
         # Extract properties
@@ -138,8 +312,7 @@ class BaseModel:
             class_name, model_name, properties, required, current_namespace, enum_values
         )
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        return file_path, content
 
     def _generate_model_content(
         self,
@@ -160,22 +333,30 @@ class BaseModel:
         # Collect referenced models for TYPE_CHECKING imports
         referenced_models = self._collect_referenced_models(properties, current_namespace)
 
-        imports = """from __future__ import annotations
+        # Python names and type hints are shared by the constructor and the properties
+        resolved = self._resolve_properties(properties)
+        members = "".join(
+            [
+                self._generate_model_from_dict(class_name, properties),
+                self._generate_model_init(resolved),
+                self._generate_model_properties(resolved, required),
+            ]
+        )
 
-from typing import List, Union, Optional, Dict, Any"""
+        parts = [_MODEL_IMPORT_HEADER]
 
         # Add TYPE_CHECKING imports for referenced models
         if referenced_models:
-            imports += ", TYPE_CHECKING\n\nif TYPE_CHECKING:"
-            for ref_import, ref_class in sorted(referenced_models):
-                imports += f"\n    from {ref_import} import {ref_class}"
+            parts.append(", TYPE_CHECKING\n\nif TYPE_CHECKING:")
+            for ref_import, ref_class in referenced_models:
+                parts.append(f"\n    from {ref_import} import {ref_class}")
 
         base_import_path = "." * (
             len(current_namespace) + 2
         )  # +2 for models folder and current file
-        imports += f"\n\nfrom {base_import_path}base.base_model import BaseModel"
+        parts.append(f"\n\nfrom {base_import_path}base.base_model import BaseModel")
 
-        class_definition = f"""
+        parts.append(f"""
 
 
 class {class_name}(BaseModel):
@@ -185,9 +366,11 @@ class {class_name}(BaseModel):
     Generated from OpenAPI/Swagger specification
     \"\"\"
 
-{self._generate_model_properties(properties, required)}"""
+    __slots__ = ()
+
+{members}""")
 
-        return imports + class_definition
+        return "".join(parts)
 
     def _generate_enum_content(
         self,
@@ -197,15 +380,13 @@ class {class_name}(BaseModel):
         current_namespace: List[str],
     ) -> str:
         """Generate the content for an enum class."""
-        imports = """from __future__ import annotations
-
-from typing import List, Union, Optional, Dict, Any"""
+        parts = [_MODEL_IMPORT_HEADER]
 
         # Calculate relative import path based on namespace depth
         base_import_path = "." * (
             len(current_namespace) + 2
         )  # +2 for models folder and current file
-        imports += f"\n\nfrom {base_import_path}base.base_model import BaseModel" ""
+        parts.append(f"\n\nfrom {base_import_path}base.base_model import BaseModel")
 
         # Generate enum constants
         enum_constants = []
@@ -218,7 +399,7 @@ from typing import List, Union, Optional, Dict, Any"""
 
         constants_str = "\n".join(enum_constants)
 
-        class_definition = f"""
+        parts.append(f"""
 
 
 class {class_name}(BaseModel):
@@ -231,98 +412,123 @@ class {class_name}(BaseModel):
 {chr(10).join(f"    - {value}" for value in enum_values)}
     \"\"\"
 
+    __slots__ = ()
+
     # Enum constants
 {constants_str}
-"""
+""")
 
-        return imports + class_definition
+        return "".join(parts)
 
     def _collect_referenced_models(
         self, properties: Dict[str, Any], current_namespace: List[str]
-    ) -> List[tuple]:
-        """Collect all referenced model names from properties with their import paths."""
-        referenced = set()
+    ) -> Tuple[Tuple[str, str], ...]:
+        """Collect all referenced model names from properties with their import paths.
+
+        Returns the (import_path, class_name) pairs as a sorted tuple, ready to be emitted.
+        """
+        # Deduplicate on the raw $ref first so each referenced schema is resolved once
+        refs = set()
 
         for prop_def in properties.values():
             # Check for direct $ref
             if "$ref" in prop_def:
-                ref = prop_def["$ref"]
-                model_name = ref.split("/")[-1]
-                import_path, class_name = self._get_model_import_path(model_name, current_namespace)
-                referenced.add((import_path, class_name))
+                refs.add(prop_def["$ref"])
 
             # Check for array items with $ref
             if prop_def.get("type") == "array":
                 items = prop_def.get("items", {})
                 if "$ref" in items:
-                    ref = items["$ref"]
-                    model_name = ref.split("/")[-1]
-                    import_path, class_name = self._get_model_import_path(
-                        model_name, current_namespace
-                    )
-                    referenced.add((import_path, class_name))
-
-        return list(referenced)
+                    refs.add(items["$ref"])
+
+        namespace = tuple(current_namespace)
+        referenced = {self._get_model_import_path(ref.split("/")[-1], namespace) for ref in refs}
+        return tuple(sorted(referenced))
+
+    def _get_model_import_path(
+        self, model_name: str, current_namespace: Tuple[str, ...]
+    ) -> Tuple[str, str]:
+        """Get the import path and class name for a model."""
+        # Models in one namespace tend to reference the same targets, so the
+        # computation is cached per (model_name, current_namespace)
+        return _compute_import_path(model_name, current_namespace)
+
+    def _resolve_properties(self, properties: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+        """Return (property name, Python name, type hint) for each property of a model."""
+        return [
+            # Sanitize property name to avoid Python keywords
+            (
+                prop_name,
+                sanitize_python_identifier(to_snake_case(prop_name)),
+                get_python_type(prop_def),
+            )
+            for prop_name, prop_def in properties.items()
+        ]
 
-    def _get_model_import_path(self, model_name: str, current_namespace: List[str]) -> tuple:
-        """Get the import path and class name for a model.
+    def _generate_model_from_dict(self, class_name: str, properties: Dict[str, Any]) -> str:
+        """Generate the declared key set and a from_dict that drops undeclared keys."""
+        if not properties:
+            # Free-form objects keep every key
+            return ""
 
-        Calculate relative import based on the current namespace and target namespace.
-        With new structure: hierarchy.folder.ClassName
-        """
-        parts = model_name.split(".")
+        keys = ", ".join(repr(prop_name) for prop_name in properties)
+        return f"""    _KEYS = frozenset({{{keys}}})
 
-        if len(parts) >= 2:
-            # Target: last part is class, second-to-last is folder, rest is hierarchy
-            class_name = sanitize_model_name(parts[-1])
-            folder_name = sanitize_model_name(parts[-2])
-            hierarchy_parts = [sanitize_model_name(p) for p in parts[:-2]] if len(parts) > 2 else []
-
-            # Target namespace includes hierarchy + folder
-            target_namespace = hierarchy_parts + [folder_name]
-        else:
-            # Target has no namespace (root level)
-            target_namespace = []
-            class_name = sanitize_model_name(model_name)
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> {class_name}:
+        \"\"\"Create model from dictionary, keeping only declared properties\"\"\"
+        keys = cls._KEYS
+        return cls({{key: value for key, value in data.items() if key in keys}})
 
-        # Find common prefix
-        common_len = 0
-        for i in range(min(len(current_namespace), len(target_namespace))):
-            if current_namespace[i] == target_namespace[i]:
-                common_len += 1
-            else:
-                break
+"""
 
-        # Calculate how many levels to go up
-        up_levels = len(current_namespace) - common_len
+    def _generate_model_init(self, properties: List[Tuple[str, str, str]]) -> str:
+        """Generate an __init__ accepting the data dict and typed keyword arguments."""
+        params = []
+        assignments = []
+        # "self" and "data" are taken by the leading parameters
+        seen = {"self", "data"}
+
+        for prop_name, python_prop_name, prop_type in properties:
+            if python_prop_name in seen:
+                continue
+            seen.add(python_prop_name)
+
+            if not prop_type.startswith("Optional["):
+                prop_type = f"Optional[{prop_type}]"
+
+            params.append(f"        {python_prop_name}: {prop_type} = None,")
+            assignments.append(
+                f"""        if {python_prop_name} is not None:
+            self._data["{prop_name}"] = {python_prop_name}"""
+            )
 
-        # Calculate path from common ancestor to target
-        down_path = target_namespace[common_len:]
+        if not params:
+            return ""
 
-        # Build import path
-        if up_levels == 0 and len(down_path) == 0:
-            # Same directory
-            import_path = f".{class_name}"
-        else:
-            # Need to navigate
-            dots = "." * (up_levels + 1)
-            if down_path:
-                import_path = f"{dots}{'.'.join(down_path)}.{class_name}"
-            else:
-                import_path = f"{dots}{class_name}"
+        params_str = "\n".join(params)
+        assignments_str = "\n".join(assignments)
+        return f"""    def __init__(
+        self,
+        data: Dict[str, Any] | None = None,
+        *,
+{params_str}
+    ):
+        \"\"\"Initialize the model from a data dictionary and/or keyword arguments\"\"\"
+        # Copy so keyword arguments never write into the caller's dict
+        data = dict(data) if data else {{}}
+        super().__init__(data)
+{assignments_str}
 
-        return import_path, class_name
+"""
 
-    def _generate_model_properties(self, properties: Dict[str, Any], required: List[str]) -> str:
+    def _generate_model_properties(
+        self, properties: List[Tuple[str, str, str]], required: List[str]
+    ) -> str:
         """Generate property getters and setters for a model."""
         prop_code = []
 
-        for prop_name, prop_def in properties.items():
-            prop_type = get_python_type(prop_def)
-
-            # Sanitize property name to avoid Python keywords
-            python_prop_name = sanitize_python_identifier(to_snake_case(prop_name))
-
+        for prop_name, python_prop_name, prop_type in properties:
             # Property getter
             prop_code.append(
                 f"""    @property
@@ -343,12 +549,11 @@ class {class_name}(BaseModel):
 
         return "\n".join(prop_code)
 
-    def _generate_models_init(self) -> None:
-        """Generate __init__.py files for models package and all subdirectories."""
+    def _generate_models_init(self) -> List[Tuple[Path, str]]:
+        """Render __init__.py files for models package and all subdirectories."""
         # Track all directories and their models
-        dir_models: Dict[Path, List[Tuple[str, str]]] = (
-            {}
-        )  # Maps directory path to list of (import_path, class_name) tuples
+        # Maps directory path to list of (import_path, class_name) tuples
+        dir_models: Dict[Path, List[Tuple[str, str]]] = defaultdict(list)
 
         for model_name in self.schemas.keys():
             parts = model_name.split(".")
@@ -368,50 +573,47 @@ class {class_name}(BaseModel):
                 model_dir = model_dir / folder_name
 
                 # Track this directory and model
-                if model_dir not in dir_models:
-                    dir_models[model_dir] = []
                 dir_models[model_dir].append((f".{class_name}", class_name))
 
                 # Track all parent directories for __init__ files
                 current_path = self.models_dir
                 for part in hierarchy_parts:
                     current_path = current_path / part
-                    if current_path not in dir_models:
-                        dir_models[current_path] = []
+                    dir_models[current_path]  # Accessing the key creates the entry
             else:
                 # Single part - add to root models directory
                 class_name = sanitize_model_name(model_name)
-                if self.models_dir not in dir_models:
-                    dir_models[self.models_dir] = []
                 dir_models[self.models_dir].append((f".{class_name}", class_name))
 
         # Ensure models directory has __init__.py even if empty
-        if self.models_dir not in dir_models:
-            dir_models[self.models_dir] = []
+        dir_models[self.models_dir]  # Accessing the key creates the entry
+
+        # Every generated package is a key of dir_models, so the subpackages of each
+        # directory can be derived without scanning the filesystem
+        children: Dict[Path, Set[str]] = defaultdict(set)
+        for dir_path in dir_models:
+            if dir_path != self.models_dir:
+                children[dir_path.parent].add(dir_path.name)
 
         # Generate __init__.py for each directory
+        init_files = []
         for dir_path, models in dir_models.items():
-            init_content = "# Generated strongly-typed model classes\n\n"
+            init_parts = ["# Generated strongly-typed model classes\n\n"]
 
             # Add imports
             for import_path, class_name in sorted(models):
-                init_content += f"from {import_path} import {class_name}\n"
+                init_parts.append(f"from {import_path} import {class_name}\n")
 
             # Add subdirectory imports if this is not a leaf directory
-            if dir_path.exists():
-                subdirs = [
-                    d.name for d in dir_path.iterdir() if d.is_dir() and not d.name.startswith("__")
-                ]
-                for subdir in sorted(subdirs):
-                    init_content += f"from . import {subdir}\n"
-            else:
-                subdirs = []
+            subdirs = sorted(children.get(dir_path, ()))
+            for subdir in subdirs:
+                init_parts.append(f"from . import {subdir}\n")
 
             # Add __all__ list
             all_names = [class_name for _, class_name in sorted(models)]
-            all_names.extend(sorted(subdirs))
-            init_content += f"\n__all__ = {all_names}\n"
+            all_names.extend(subdirs)
+            init_parts.append(f"\n__all__ = {all_names}\n")
+
+            init_files.append((dir_path / "__init__.py", "".join(init_parts)))
 
-            init_file = dir_path / "__init__.py"
-            with open(init_file, "w", encoding="utf-8") as f:
-                f.write(init_content)
+        return init_files
@@ -3,10 +3,32 @@ OpenAPI 3.0+ specific API generator.
 Supports OpenAPI 3.0.x, 3.1.x, and 3.2.x specifications.
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, ClassVar, Dict, Any, List, Optional, Tuple
 from pathlib import Path
-from .base_api_generator import BaseAPIGenerator
-from .utils import get_python_type, sanitize_model_name
+from .base_api_generator import REF_PREFIX_OPENAPI3, BaseAPIGenerator, ref_class_name
+from .utils import get_python_type
+
+# Media types tried in order when picking the schema of a body or response
+_CONTENT_PRIORITY = ("application/json", "application/xml", "text/plain")
+
+# Resolves one schema keyword to a type hint, or returns None to defer to the next keyword
+_SchemaHandler = Callable[["OpenAPI30APIGenerator", Dict[str, Any]], Optional[str]]
+
+
+def _select_content_schema(
+    content: Dict[str, Any],
+) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Pick the media type and schema to use from a content map.
+
+    JSON content is preferred; without a schema for a preferred type, the first
+    media type listed is used.
+    """
+    content_type = next((t for t in _CONTENT_PRIORITY if t in content), None)
+    schema = content[content_type].get("schema") if content_type is not None else None
+    if not schema and content:
+        content_type = next(iter(content))
+        schema = content[content_type].get("schema")
+    return content_type, schema
 
 
 class OpenAPI30APIGenerator(BaseAPIGenerator):
@@ -25,6 +47,9 @@ class OpenAPI30APIGenerator(BaseAPIGenerator):
         self.spec_data = spec_data
         # Will be set by the main generator; type as optional mapping
         self.version_info: Optional[Dict[str, Any]] = None
+        # Resolved types keyed by (schema id, version family); each entry also holds
+        # the schema itself so its id cannot be reused while the entry exists
+        self._resolve_cache: Dict[Tuple[int, Optional[str]], Tuple[Dict[str, Any], str]] = {}
 
     def _supports_feature(self, feature: str) -> bool:
         """Check if the current OpenAPI version supports a specific feature."""
@@ -61,27 +86,8 @@ class OpenAPI30APIGenerator(BaseAPIGenerator):
             return None
 
         required = request_body.get("required", False)
-        content = request_body.get("content", {})
-
-        # Try to get JSON content first, then fallback to others
-        content_type_keys = list(content.keys())
-        preferred_content_types = ["application/json", "application/xml", "text/plain"]
-
-        schema = None
-        is_json = True
-
-        # Look for preferred content types first
-        for content_type in preferred_content_types:
-            if content_type in content:
-                schema = content[content_type].get("schema")
-                is_json = content_type == "application/json"
-                break
-
-        # If no preferred type found, use the first available
-        if not schema and content_type_keys:
-            first_content_type = content_type_keys[0]
-            schema = content[first_content_type].get("schema")
-            is_json = "json" in first_content_type.lower()
+        content_type, schema = _select_content_schema(request_body.get("content", {}))
+        is_json = "json" in content_type.lower() if content_type else True
 
         if not schema:
             return {"type": "Any", "required": required, "is_json": is_json}
@@ -93,18 +99,7 @@ class OpenAPI30APIGenerator(BaseAPIGenerator):
 
     def _get_response_model(self, operation: Dict[str, Any]) -> Optional[str]:
         """Get response model type for OpenAPI 3.0."""
-        responses = operation.get("responses", {})
-
-        # Look for successful response (200, 201, etc.)
-        success_response = None
-        for status_code, response in responses.items():
-            if isinstance(status_code, str) and status_code.startswith("2"):
-                success_response = response
-                break
-            elif isinstance(status_code, int) and 200 <= status_code < 300:
-                success_response = response
-                break
-
+        success_response = self._find_success_response(operation)
         if not success_response:
             return None
 
@@ -112,74 +107,35 @@ class OpenAPI30APIGenerator(BaseAPIGenerator):
         if not content:
             return None
 
-        # Try to get JSON content first, then others
-        schema = None
-        content_type_keys = list(content.keys())
-        preferred_content_types = ["application/json", "application/xml", "text/plain"]
-
-        for content_type in preferred_content_types:
-            if content_type in content:
-                schema = content[content_type].get("schema")
-                break
-
-        if not schema and content_type_keys:
-            first_content_type = content_type_keys[0]
-            schema = content[first_content_type].get("schema")
-
+        _, schema = _select_content_schema(content)
         if not schema:
             return None
 
         return self._resolve_schema_type(schema)
 
     def _resolve_schema_type(self, schema: Dict[str, Any]) -> str:
+        """Resolve schema to Python type for OpenAPI 3.0+, caching per schema object."""
+        # The same schema objects are resolved again for every parameter, body and
+        # response that references them; the result also depends on the version
+        family = self.version_info.get("version_family") if self.version_info else None
+        key = (id(schema), family)
+        cached = self._resolve_cache.get(key)
+        if cached is not None:
+            return cached[1]
+
+        type_name = self._resolve_schema_type_uncached(schema)
+        self._resolve_cache[key] = (schema, type_name)
+        return type_name
+
+    def _resolve_schema_type_uncached(self, schema: Dict[str, Any]) -> str:
         """Resolve schema to Python type for OpenAPI 3.0+."""
-        # Handle $ref
-        if "$ref" in schema:
-            ref_path = schema["$ref"]
-            if ref_path.startswith("#/components/schemas/"):
-                model_name = ref_path.split("/")[-1]
-                # Return just the class name (last part)
-                parts = model_name.split(".")
-                return sanitize_model_name(parts[-1]) if parts else sanitize_model_name(model_name)
-            else:
-                return "Any"
-
-        # Handle const keyword (OpenAPI 3.1+)
-        if "const" in schema and self._supports_feature("const_keyword"):
-            const_value = schema["const"]
-            if isinstance(const_value, str):
-                return "str"
-            elif isinstance(const_value, (int, float)):
-                return "Union[int, float]"
-            elif isinstance(const_value, bool):
-                return "bool"
-            else:
-                return "Any"
-
-        # Handle array type
-        if schema.get("type") == "array":
-            items = schema.get("items", {})
-            item_type = self._resolve_schema_type(items)
-            return f"List[{item_type}]"
-
-        # Handle object with properties (inline schema)
-        if schema.get("type") == "object" and "properties" in schema:
-            return "Dict[str, Any]"
-
-        # Handle oneOf, anyOf, allOf with enhanced support
-        if "oneOf" in schema or "anyOf" in schema:
-            # For union types, we could be more sophisticated in OpenAPI 3.1+
-            if self._supports_feature("json_schema_draft_2020_12"):
-                # Could implement more advanced union type detection
-                return "Any"
-            return "Any"
-
-        if "allOf" in schema:
-            # For allOf, try to resolve the first schema that has a $ref
-            for sub_schema in schema["allOf"]:
-                if "$ref" in sub_schema:
-                    return self._resolve_schema_type(sub_schema)
-            return "Any"
+        # Keyword handlers are probed in precedence order; a handler that returns
+        # None leaves the schema to the next one
+        for keyword, handler in self._KEYWORD_HANDLERS.items():
+            if keyword in schema:
+                type_name = handler(self, schema)
+                if type_name is not None:
+                    return type_name
 
         # Handle simple types
         schema_type = schema.get("type", "object")
@@ -187,6 +143,54 @@ class OpenAPI30APIGenerator(BaseAPIGenerator):
 
         return get_python_type(schema_type, schema_format, quote_refs=False)
 
+    def _resolve_ref(self, schema: Dict[str, Any]) -> Optional[str]:
+        """Resolve a $ref to just the class name (last part)."""
+        return ref_class_name(schema["$ref"], REF_PREFIX_OPENAPI3) or "Any"
+
+    def _resolve_const(self, schema: Dict[str, Any]) -> Optional[str]:
+        """Resolve the const keyword (OpenAPI 3.1+)."""
+        if not self._supports_feature("const_keyword"):
+            return None
+        const_value = schema["const"]
+        if isinstance(const_value, str):
+            return "str"
+        elif isinstance(const_value, (int, float)):
+            return "Union[int, float]"
+        elif isinstance(const_value, bool):
+            return "bool"
+        else:
+            return "Any"
+
+    def _resolve_typed(self, schema: Dict[str, Any]) -> Optional[str]:
+        """Resolve arrays and inline objects; other types are simple types."""
+        schema_type = schema["type"]
+        if schema_type == "array":
+            item_type = self._resolve_schema_type(schema.get("items", {}))
+            return f"List[{item_type}]"
+        if schema_type == "object" and "properties" in schema:
+            return "Dict[str, Any]"
+        return None
+
+    def _resolve_union(self, schema: Dict[str, Any]) -> Optional[str]:
+        """Resolve oneOf/anyOf, which are not narrowed to a Union yet."""
+        return "Any"
+
+    def _resolve_all_of(self, schema: Dict[str, Any]) -> Optional[str]:
+        """Resolve allOf to the first sub-schema that has a $ref."""
+        for sub_schema in schema["allOf"]:
+            if "$ref" in sub_schema:
+                return self._resolve_schema_type(sub_schema)
+        return "Any"
+
+    _KEYWORD_HANDLERS: ClassVar[Dict[str, _SchemaHandler]] = {
+        "$ref": _resolve_ref,
+        "const": _resolve_const,
+        "type": _resolve_typed,
+        "oneOf": _resolve_union,
+        "anyOf": _resolve_union,
+        "allOf": _resolve_all_of,
+    }
+
     def _get_content_types(self, operation: Dict[str, Any]) -> Tuple[List[str], List[str]]:
         """Get consumes and produces content types for OpenAPI 3.0."""
         consumes = []
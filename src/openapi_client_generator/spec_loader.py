@@ -2,10 +2,29 @@
 Specification loader for OpenAPI/Swagger files.
 """
 
+import importlib
 import json
+from pathlib import Path
 from typing import Dict, Any, List, Tuple, cast
 import re
 
+try:
+    # Optional C-accelerated JSON parser (pip install openapi-client-python[fast])
+    _orjson: Any = importlib.import_module("orjson")
+except ImportError:
+    _orjson = None
+
+
+def _parse_json(raw: bytes) -> Any:
+    """Parse a JSON document from bytes, with orjson when it is installed."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(raw)
+        except ValueError:
+            # The stdlib parser also accepts NaN/Infinity and integers beyond 64 bits
+            pass
+    return json.loads(raw)
+
 
 class SpecLoader:
     """Loads and validates OpenAPI/Swagger specifications."""
@@ -27,7 +46,19 @@ class SpecLoader:
     def __init__(self, spec_file: str) -> None:
         """Initialize with specification file path."""
         self.spec_file = spec_file
-        self.spec_data = self._load_spec()
+        self._set_spec_data(self._load_spec())
+
+    @classmethod
+    def _from_mapping(cls, spec_data: Dict[str, Any], spec_file: str = "<mapping>") -> "SpecLoader":
+        """Create a loader from already parsed specification data, without reading a file."""
+        loader = cls.__new__(cls)
+        loader.spec_file = spec_file
+        loader._set_spec_data(spec_data)
+        return loader
+
+    def _set_spec_data(self, spec_data: Dict[str, Any]) -> None:
+        """Store the parsed specification and detect its version."""
+        self.spec_data = spec_data
         self.version, self.version_family = self._detect_spec_version()
         # Legacy compatibility property
         self.is_openapi3 = self.version_family.startswith("openapi")
@@ -35,9 +66,9 @@ class SpecLoader:
     def _load_spec(self) -> Dict[str, Any]:
         """Load and parse the OpenAPI/Swagger specification."""
         try:
-            with open(self.spec_file, "r", encoding="utf-8") as f:
-                # json.load returns Any; cast to expected dict shape
-                return cast(Dict[str, Any], json.load(f))
+            # Parse the raw bytes directly rather than decoding to text first;
+            # the parser returns Any, so cast to the expected dict shape
+            return cast(Dict[str, Any], _parse_json(Path(self.spec_file).read_bytes()))
         except Exception as e:
             raise ValueError(f"Failed to load spec file {self.spec_file}: {e}")
 
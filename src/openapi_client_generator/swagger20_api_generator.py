@@ -4,8 +4,8 @@ Swagger 2.0 specific API generator.
 
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
-from .base_api_generator import BaseAPIGenerator
-from .utils import get_python_type, sanitize_model_name
+from .base_api_generator import REF_PREFIX_SWAGGER2, BaseAPIGenerator, ref_class_name
+from .utils import get_python_type
 
 
 class Swagger20APIGenerator(BaseAPIGenerator):
@@ -36,31 +36,14 @@ class Swagger20APIGenerator(BaseAPIGenerator):
 
         # Determine the type from schema
         if "$ref" in schema:
-            # Extract model name from $ref
-            ref_path = schema["$ref"]
-            if ref_path.startswith("#/definitions/"):
-                model_name = ref_path.split("/")[-1]
-                # Return just the class name (last part)
-                parts = model_name.split(".")
-                type_name = (
-                    sanitize_model_name(parts[-1]) if parts else sanitize_model_name(model_name)
-                )
-            else:
-                type_name = "Any"
+            # Extract model name from $ref, just the class name (last part)
+            type_name = ref_class_name(schema["$ref"], REF_PREFIX_SWAGGER2) or "Any"
         elif schema.get("type") == "array":
             # Handle array type
             items = schema.get("items", {})
             if "$ref" in items:
-                item_ref = items["$ref"]
-                if item_ref.startswith("#/definitions/"):
-                    item_model = item_ref.split("/")[-1]
-                    parts = item_model.split(".")
-                    item_type = (
-                        sanitize_model_name(parts[-1]) if parts else sanitize_model_name(item_model)
-                    )
-                    type_name = f"List[{item_type}]"
-                else:
-                    type_name = "List[Any]"
+                item_type = ref_class_name(items["$ref"], REF_PREFIX_SWAGGER2) or "Any"
+                type_name = f"List[{item_type}]"
             else:
                 item_type = get_python_type(
                     items.get("type", "string"), items.get("format"), quote_refs=False
@@ -80,18 +63,7 @@ class Swagger20APIGenerator(BaseAPIGenerator):
 
     def _get_response_model(self, operation: Dict[str, Any]) -> Optional[str]:
         """Get response model type for Swagger 2.0."""
-        responses = operation.get("responses", {})
-
-        # Look for successful response (200, 201, etc.)
-        success_response = None
-        for status_code, response in responses.items():
-            if isinstance(status_code, str) and status_code.startswith("2"):
-                success_response = response
-                break
-            elif isinstance(status_code, int) and 200 <= status_code < 300:
-                success_response = response
-                break
-
+        success_response = self._find_success_response(operation)
         if not success_response:
             return None
 
@@ -102,25 +74,13 @@ class Swagger20APIGenerator(BaseAPIGenerator):
         # Handle different schema types
         if "$ref" in schema:
             # Direct model reference
-            ref_path = schema["$ref"]
-            if ref_path.startswith("#/definitions/"):
-                model_name = ref_path.split("/")[-1]
-                parts = model_name.split(".")
-                return sanitize_model_name(parts[-1]) if parts else sanitize_model_name(model_name)
+            return ref_class_name(schema["$ref"], REF_PREFIX_SWAGGER2)
         elif schema.get("type") == "array":
             # Array response
             items = schema.get("items", {})
             if "$ref" in items:
-                item_ref = items["$ref"]
-                if item_ref.startswith("#/definitions/"):
-                    item_model = item_ref.split("/")[-1]
-                    parts = item_model.split(".")
-                    item_type = (
-                        sanitize_model_name(parts[-1]) if parts else sanitize_model_name(item_model)
-                    )
-                    return f"List[{item_type}]"
-                else:
-                    return "List[Any]"
+                item_type = ref_class_name(items["$ref"], REF_PREFIX_SWAGGER2) or "Any"
+                return f"List[{item_type}]"
             else:
                 item_type = get_python_type(
                     items.get("type", "string"), items.get("format"), quote_refs=False
@@ -4,11 +4,34 @@ Utility functions for the OpenAPI client generator.
 
 import re
 import keyword
+import string
+from functools import lru_cache
 from typing import Dict, Any, Union, Optional
 
+# Patterns used by the name sanitizers, compiled once at import time
+_RE_NONIDENT = re.compile(r"[^a-zA-Z0-9_]")
+_RE_NONIDENT_BRACES = re.compile(r"[^a-zA-Z0-9_{}]")
+_RE_BRACE_PLACEHOLDER = re.compile(r"\{([^}]+)\}")
+_RE_APIV = re.compile(r"_api_v\d*_")
+_RE_UNDER = re.compile(r"_+")
+_RE_CAMEL1 = re.compile(r"(.)([A-Z][a-z]+)")
+_RE_CAMEL2 = re.compile(r"([a-z0-9])([A-Z])")
 
+# Maps every ASCII character that is not valid in an identifier to "_"
+_VALID_IDENT_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+_IDENT_TRANSLATE = {c: "_" for c in range(128) if chr(c) not in _VALID_IDENT_CHARS}
+
+# The name helpers below are pure functions of their argument and are called
+# repeatedly with the same schema, property and path names, so they are memoized.
+
+
+@lru_cache(maxsize=4096)
 def sanitize_python_identifier(name: str) -> str:
     """Sanitize identifier to avoid Python keywords and invalid names."""
+    # Most names are already valid identifiers and need no changes
+    if name.isidentifier() and not keyword.iskeyword(name):
+        return name
+
     # If it's a Python keyword, append underscore
     if keyword.iskeyword(name):
         return f"{name}_"
@@ -20,38 +43,51 @@ def sanitize_python_identifier(name: str) -> str:
     return name
 
 
+@lru_cache(maxsize=4096)
 def sanitize_model_name(model_name: str) -> str:
     """Sanitize model name to be a valid Python identifier."""
+    # Plain ASCII alphanumeric names such as "User" or "Pet2" are returned unchanged;
+    # names with underscores still go through the underscore cleanup below
+    if model_name.isascii() and model_name.isalnum() and not model_name[0].isdigit():
+        return model_name
+
     # Replace dots, spaces, and other invalid characters with underscores
-    sanitized = re.sub(r"[^a-zA-Z0-9_]", "_", model_name)
+    sanitized = model_name.translate(_IDENT_TRANSLATE)
+    if not sanitized.isascii():
+        sanitized = _RE_NONIDENT.sub("_", sanitized)
     # Ensure it doesn't start with a digit
     if sanitized[0].isdigit():
         sanitized = f"Model_{sanitized}"
     # Remove multiple consecutive underscores
-    sanitized = re.sub(r"_+", "_", sanitized)
+    sanitized = _RE_UNDER.sub("_", sanitized)
     # Remove trailing underscores
     sanitized = sanitized.strip("_")
     return sanitized
 
 
+@lru_cache(maxsize=4096)
 def to_snake_case(name: str) -> str:
     """Convert string to snake_case."""
+    # Lowercase alphanumeric names such as "limit" or "v2" contain nothing to convert
+    if name.isascii() and name.isalnum() and name.islower():
+        return f"op_{name}" if name[0].isdigit() else name
+
     # Sanitize invalid characters
-    sanitized = re.sub(r"[^a-zA-Z0-9_{}]", "_", name)
+    sanitized = _RE_NONIDENT_BRACES.sub("_", name)
 
     # Convert version placeholders {id} to _id_
-    sanitized = re.sub(r"\{([^}]+)\}", r"_\1_", sanitized)
+    sanitized = _RE_BRACE_PLACEHOLDER.sub(r"_\1_", sanitized)
 
     # Clean up patterns
-    sanitized = re.sub(r"_api_v\d*_", "_", sanitized)
-    sanitized = re.sub(r"_+", "_", sanitized).strip("_")
+    sanitized = _RE_APIV.sub("_", sanitized)
+    sanitized = _RE_UNDER.sub("_", sanitized).strip("_")
 
     # Handle camelCase and PascalCase
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", sanitized)
-    result = re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    s1 = _RE_CAMEL1.sub(r"\1_\2", sanitized)
+    result = _RE_CAMEL2.sub(r"\1_\2", s1).lower()
 
     # Final cleanup
-    result = re.sub(r"_+", "_", result).strip("_")
+    result = _RE_UNDER.sub("_", result).strip("_")
 
     # Ensure valid identifier
     if result and result[0].isdigit():
@@ -63,11 +99,32 @@ def to_snake_case(name: str) -> str:
     return result
 
 
+@lru_cache(maxsize=4096)
 def to_pascal_case(name: str) -> str:
     """Convert string to PascalCase."""
     return "".join(word.capitalize() for word in name.replace("-", "_").split("_"))
 
 
+# OpenAPI/Swagger primitive type names mapped to Python type hints
+_TYPE_MAPPING: Dict[str, str] = {
+    "string": "str",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+    "array": "List",
+    "object": "Dict[str, Any]",
+    "file": "Any",
+}
+
+# Plain type strings carry no items or nullable flag, so they map straight to a hint
+_STR_TYPE_MAPPING: Dict[str, str] = {**_TYPE_MAPPING, "array": "List[str]"}
+
+
+def _optional(type_hint: str, nullable: bool) -> str:
+    """Wrap a type hint in Optional[...] when the schema is nullable."""
+    return f"Optional[{type_hint}]" if nullable else type_hint
+
+
 def get_python_type(
     type_def: Union[str, Dict[str, Any]], format_str: Optional[str] = None, quote_refs: bool = True
 ) -> str:
@@ -82,18 +139,14 @@ def get_python_type(
         format_str: Optional format string
         quote_refs: If True, quote $ref types (for TYPE_CHECKING imports), else for annotations
     """
-    # Normalize to a dict-like structure for lookups
     if isinstance(type_def, str):
-        type_str: Optional[str] = type_def
-        type_def_dict: Dict[str, Any] = {"type": type_str, "format": format_str}
-    else:
-        type_def_dict = type_def
+        # Simple type string: look it up directly
+        return _STR_TYPE_MAPPING.get(type_def, "Any")
 
-    # Determine nullability early
-    nullable = bool(type_def_dict.get("nullable", False))
+    type_def_dict = type_def
 
     # Handle $ref to another schema - check this FIRST before extracting type
-    if isinstance(type_def, dict) and "$ref" in type_def_dict:
+    if "$ref" in type_def_dict:
         ref = type_def_dict["$ref"]
         # Extract model name from ref like "#/components/schemas/ModelName"
         model_name = ref.split("/")[-1]
@@ -102,34 +155,24 @@ def get_python_type(
         class_name = sanitize_model_name(parts[-1]) if parts else sanitize_model_name(model_name)
         # Return as quoted string for forward reference if requested
         result_type = f"'{class_name}'" if quote_refs else class_name
-        return f"Optional[{result_type}]" if nullable else result_type
+        return _optional(result_type, bool(type_def_dict.get("nullable", False)))
 
+    nullable = bool(type_def_dict.get("nullable", False))
     type_str = type_def_dict.get("type")
 
-    type_mapping: Dict[str, str] = {
-        "string": "str",
-        "integer": "int",
-        "number": "float",
-        "boolean": "bool",
-        "array": "List",
-        "object": "Dict[str, Any]",
-        "file": "Any",
-    }
-
     if type_str == "array":
         items = type_def_dict.get("items", {})
         # Pass through quote_refs for inner type as well
-        item_type = get_python_type(items, quote_refs=quote_refs) if isinstance(items, dict) else get_python_type(items)
-        result = f"List[{item_type}]"
-        return f"Optional[{result}]" if nullable else result
+        if isinstance(items, dict):
+            item_type = get_python_type(items, quote_refs=quote_refs)
+        else:
+            item_type = get_python_type(items)
+        return _optional(f"List[{item_type}]", nullable)
 
-    if type_str in type_mapping:
-        result = type_mapping[type_str]
-        return f"Optional[{result}]" if nullable else result
+    if type_str in _TYPE_MAPPING:
+        return _optional(_TYPE_MAPPING[type_str], nullable)
 
     if type_str is None:
-        result = "str"
-        return f"Optional[{result}]" if nullable else result
+        return _optional("str", nullable)
 
-    result = "Any"
-    return f"Optional[{result}]" if nullable else result
+    return _optional("Any", nullable)
@@ -78,7 +78,9 @@ def test_cli_successful_generation(mock_print, temp_spec_file, temp_output_dir):
             main()
 
             # Verify generator was called correctly
-            mock_generator.assert_called_once_with(temp_spec_file, temp_output_dir, "test_service")
+            mock_generator.assert_called_once_with(
+                temp_spec_file, temp_output_dir, "test_service", None
+            )
             mock_instance.generate_client.assert_called_once()
 
             # Verify success message was printed
@@ -123,6 +125,8 @@ def test_cli_all_arguments(temp_spec_file, temp_output_dir):
         temp_output_dir,
         "--service-name",
         "test_service",
+        "--cache-dir",
+        "cache",
     ]
 
     with patch("sys.argv", args):
@@ -133,7 +137,9 @@ def test_cli_all_arguments(temp_spec_file, temp_output_dir):
             main()
 
             # Verify all arguments were passed correctly
-            mock_generator.assert_called_once_with(temp_spec_file, temp_output_dir, "test_service")
+            mock_generator.assert_called_once_with(
+                temp_spec_file, temp_output_dir, "test_service", "cache"
+            )
 
 
 def test_cli_invalid_spec_file():
@@ -0,0 +1,90 @@
+"""
+Shared pytest fixtures.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+from openapi_client_generator.base_api_generator import BaseAPIGenerator
+from openapi_client_generator.spec_loader import SpecLoader
+
+
+class _DummyGen(BaseAPIGenerator):
+    """Concrete generator with no-op hooks, for testing the shared base behaviour."""
+
+    def _get_request_body_info(self, operation):
+        return None
+
+    def _get_response_model(self, operation):
+        return None
+
+    def _get_content_types(self, operation):
+        return ([], [])
+
+
+def _spec_bytes(spec):
+    """Encode a spec dict as canonical JSON, so equal specs give equal bytes."""
+    return json.dumps(spec, sort_keys=True).encode("utf-8")
+
+
+def _by_identity(func):
+    """Wrap a function of a spec dict, caching its results on the dict's identity.
+
+    Repeated calls with the same dict skip encoding it. Each entry keeps its spec
+    alive so the id is not reused; specs must not be modified once passed in.
+    """
+    entries = {}
+
+    def lookup(spec):
+        entry = entries.get(id(spec))
+        if entry is None:
+            entry = entries[id(spec)] = (spec, func(spec))
+        return entry[1]
+
+    return lookup
+
+
+@pytest.fixture(scope="session")
+def spec_loader_factory():
+    """Load spec dicts through SpecLoader, building one loader per spec dict per run.
+
+    The returned loaders are shared between tests and must not be modified.
+    """
+    return _by_identity(SpecLoader._from_mapping)
+
+
+@pytest.fixture(scope="session")
+def spec_file_factory(tmp_path_factory):
+    """Write spec dicts to JSON files, writing each distinct spec once per run.
+
+    Equal specs passed as different dicts are encoded again but share one file.
+    Returns the file path as a string; the files are shared and must not be modified.
+    """
+    spec_dir = tmp_path_factory.mktemp("specs")
+
+    @lru_cache(maxsize=None)
+    def write(raw):
+        path = spec_dir / f"{hashlib.blake2b(raw, digest_size=16).hexdigest()}.json"
+        path.write_bytes(raw)
+        return str(path)
+
+    def factory(spec):
+        return write(_spec_bytes(spec))
+
+    return _by_identity(factory)
+
+
+@pytest.fixture(scope="module")
+def spec_dir(tmp_path_factory):
+    """Directory shared by the tests of one module; tests must use distinct file names."""
+    return tmp_path_factory.mktemp("module")
+
+
+@pytest.fixture
+def dummy_generator():
+    """A _DummyGen without paths or schemas; it never writes to its output directory."""
+    return _DummyGen({}, {}, "s", Path("."))
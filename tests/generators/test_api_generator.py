@@ -231,6 +231,9 @@ class TestAPIGenerator(unittest.TestCase):
         self.assertEqual(get_user_by_id["method"], "GET")
         self.assertEqual(get_user_by_id["path"], "/users/{id}")
 
+        # Paths are only walked once per generator
+        self.assertIs(generator._extract_operations(), operations)
+
     def test_response_model_detection_openapi3(self):
         """Test response model detection for OpenAPI 3.0."""
         spec_data = {"openapi": "3.0.0", "info": {"title": "Test API", "version": "1.0.0"}}
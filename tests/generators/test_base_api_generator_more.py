@@ -1,4 +1,12 @@
-from openapi_client_generator.base_api_generator import BaseAPIGenerator
+import pytest
+
+from openapi_client_generator.base_api_generator import (
+    REF_PREFIX_OPENAPI3,
+    REF_PREFIX_SWAGGER2,
+    BaseAPIGenerator,
+    _classify_response,
+    ref_class_name,
+)
 
 
 def test_single_model_response_and_optional_body(tmp_path):
@@ -30,6 +38,9 @@ def test_single_model_response_and_optional_body(tmp_path):
     assert "payload: User = None" in content
     # single model response uses from_dict
     assert "return User.from_dict(response.json())" in content
+    # model payloads are sent as pre-encoded JSON bytes
+    assert 'body = {"data": bytes(payload)}' in content
+    assert "**body)" in content
 
 
 def test_primitive_responses_int_and_bool(tmp_path):
@@ -117,3 +128,26 @@ def test_method_name_generation_from_path(tmp_path):
     # generated method name should include both path parts
     content = gen._generate_apis_content("SvcAPIs", ops)
     assert "def get_a_b(" in content or "def get_a_b_" in content
+
+
+@pytest.mark.parametrize(
+    "response_model, expected",
+    [
+        (None, ("raw", "")),
+        ("requests.Response", ("raw", "")),
+        ("str", ("text", "")),
+        ("Dict[str, Any]", ("json", "")),
+        ("List[User]", ("list", "User")),
+        ("User", ("model", "User")),
+    ],
+)
+def test_classify_response(response_model, expected):
+    assert _classify_response(response_model) == expected
+
+
+def test_ref_class_name():
+    assert ref_class_name("#/components/schemas/pkg.sub.User", REF_PREFIX_OPENAPI3) == "User"
+    assert ref_class_name("#/definitions/Pet-Item", REF_PREFIX_SWAGGER2) == "Pet_Item"
+    # refs outside the version's schema section are not models
+    assert ref_class_name("#/definitions/Pet", REF_PREFIX_OPENAPI3) is None
+    assert ref_class_name("other.json#/Pet", REF_PREFIX_SWAGGER2) is None
@@ -2,6 +2,8 @@
 Unit tests for the model_generator module.
 """
 
+import importlib
+import sys
 import unittest
 import tempfile
 import shutil
@@ -12,45 +14,58 @@ from openapi_client_generator.model_generator import ModelGenerator
 class TestModelGenerator(unittest.TestCase):
     """Test cases for ModelGenerator class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-
-        # Sample schemas
-        self.schemas = {
-            "User": {
-                "type": "object",
-                "properties": {
-                    "id": {"type": "integer"},
-                    "name": {"type": "string"},
-                    "email": {"type": "string"},
-                    "active": {"type": "boolean"},
-                },
-                "required": ["id", "name"],
+    # Sample schemas
+    SCHEMAS = {
+        "User": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer"},
+                "name": {"type": "string"},
+                "email": {"type": "string"},
+                "active": {"type": "boolean"},
             },
-            "Product": {
-                "type": "object",
-                "properties": {
-                    "productId": {"type": "integer"},
-                    "productName": {"type": "string"},
-                    "price": {"type": "number"},
-                    "tags": {"type": "array", "items": {"type": "string"}},
-                },
-                "required": ["productId", "productName"],
+            "required": ["id", "name"],
+        },
+        "Product": {
+            "type": "object",
+            "properties": {
+                "productId": {"type": "integer"},
+                "productName": {"type": "string"},
+                "price": {"type": "number"},
+                "tags": {"type": "array", "items": {"type": "string"}},
             },
-        }
+            "required": ["productId", "productName"],
+        },
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        """Generate the sample models once; most tests only read the output."""
+        cls.generated_dir = Path(tempfile.mkdtemp())
+        ModelGenerator(cls.SCHEMAS, cls.generated_dir).generate_models()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared output."""
+        shutil.rmtree(cls.generated_dir)
+
+    def setUp(self):
+        """Set up a fresh directory for tests that generate their own models."""
+        self.temp_dir = Path(tempfile.mkdtemp())
 
     def tearDown(self):
         """Clean up test fixtures."""
         shutil.rmtree(self.temp_dir)
 
+    def assertContainsAll(self, content, snippets):
+        """Assert every snippet occurs in content, reporting all missing ones at once."""
+        missing = [snippet for snippet in snippets if content.find(snippet) == -1]
+        self.assertEqual(missing, [], "snippets missing from generated content")
+
     def test_model_generation(self):
         """Test generating model classes."""
-        generator = ModelGenerator(self.schemas, self.temp_dir)
-        generator.generate_models()
-
         # Check that models directory was created
-        models_dir = self.temp_dir / "models"
+        models_dir = self.generated_dir / "models"
         self.assertTrue(models_dir.exists())
         self.assertTrue(models_dir.is_dir())
 
@@ -65,41 +80,65 @@ class TestModelGenerator(unittest.TestCase):
 
     def test_user_model_content(self):
         """Test the content of generated User model."""
-        generator = ModelGenerator(self.schemas, self.temp_dir)
-        generator.generate_models()
-
-        user_file = self.temp_dir / "models" / "User.py"
+        user_file = self.generated_dir / "models" / "User.py"
         with open(user_file, "r", encoding="utf-8") as f:
             content = f.read()
 
         # Check for class definition with BaseModel inheritance
         self.assertIn("class User(BaseModel):", content)
 
-        # Check for imports
-        self.assertIn("from __future__ import annotations", content)
-        self.assertIn("from ..base.base_model import BaseModel", content)
-        self.assertIn("from typing import List, Union, Optional, Dict, Any", content)
-
-        # Check for properties
-        self.assertIn("def id(self)", content)
-        self.assertIn("def name(self)", content)
-        self.assertIn("def email(self)", content)
-        self.assertIn("def active(self)", content)
-
-        # Check for setters
-        self.assertIn("@id.setter", content)
-        self.assertIn("@name.setter", content)
+        self.assertContainsAll(
+            content,
+            (
+                # Check for imports
+                "from __future__ import annotations",
+                "from ..base.base_model import BaseModel",
+                "from typing import List, Union, Optional, Dict, Any",
+                # Check for properties
+                "def id(self)",
+                "def name(self)",
+                "def email(self)",
+                "def active(self)",
+                # Check for setters
+                "@id.setter",
+                "@name.setter",
+                # Constructor takes the data dict first and properties as keywords
+                "data: Dict[str, Any] | None = None,\n        *,",
+                "        id: Optional[int] = None,",
+                '            self._data["email"] = email',
+                # Undeclared keys are dropped by from_dict
+                "_KEYS = frozenset({'id', 'name', 'email', 'active'})",
+                "def from_dict(cls, data: Dict[str, Any]) -> User:",
+            ),
+        )
+
+        # Data lives in the base class slot, so subclasses declare no slots of their own
+        self.assertIn("    __slots__ = ()\n", content)
+        base_content = (self.generated_dir / "base" / "base_model.py").read_text(encoding="utf-8")
+        self.assertIn('__slots__ = ("_data",)', base_content)
 
         # Note: utility methods (to_dict, to_json, from_dict, from_json)
         # are now inherited from BaseModel so they should NOT be in the
         # generated model code
 
+    def test_keyword_arguments_do_not_mutate_caller_data(self):
+        """Test that the generated constructor copies the data dict it is given."""
+        ModelGenerator(self.SCHEMAS, self.temp_dir).generate_models()
+        sys.path.insert(0, str(self.temp_dir.parent))
+        try:
+            user_module = importlib.import_module(f"{self.temp_dir.name}.models.User")
+        finally:
+            sys.path.remove(str(self.temp_dir.parent))
+
+        data = {"id": 1}
+        user = user_module.User(data, name="x")
+
+        self.assertEqual(data, {"id": 1})
+        self.assertEqual(user.to_dict(), {"id": 1, "name": "x"})
+
     def test_product_model_content(self):
         """Test the content of generated Product model."""
-        generator = ModelGenerator(self.schemas, self.temp_dir)
-        generator.generate_models()
-
-        product_file = self.temp_dir / "models" / "Product.py"
+        product_file = self.generated_dir / "models" / "Product.py"
         with open(product_file, "r", encoding="utf-8") as f:
             content = f.read()
 
@@ -107,17 +146,14 @@ class TestModelGenerator(unittest.TestCase):
         self.assertIn("class Product(BaseModel):", content)
 
         # Check for properties with snake_case conversion
-        self.assertIn("def product_id(self)", content)
-        self.assertIn("def product_name(self)", content)
-        self.assertIn("def price(self)", content)
-        self.assertIn("def tags(self)", content)
+        self.assertContainsAll(
+            content,
+            ("def product_id(self)", "def product_name(self)", "def price(self)", "def tags(self)"),
+        )
 
     def test_models_init_file(self):
         """Test the content of models __init__.py file."""
-        generator = ModelGenerator(self.schemas, self.temp_dir)
-        generator.generate_models()
-
-        init_file = self.temp_dir / "models" / "__init__.py"
+        init_file = self.generated_dir / "models" / "__init__.py"
         with open(init_file, "r", encoding="utf-8") as f:
             content = f.read()
 
@@ -130,6 +166,53 @@ class TestModelGenerator(unittest.TestCase):
         self.assertIn("'Product'", content)
         self.assertIn("__all__", content)
 
+    def test_unchanged_schemas_are_not_rewritten(self):
+        """Test that regenerating with a cache dir skips models that did not change."""
+        cache_dir = self.temp_dir / "cache"
+        output_dir = self.temp_dir / "out"
+        ModelGenerator(self.SCHEMAS, output_dir, cache_dir).generate_models()
+        # The cache lives outside the generated package
+        self.assertEqual(len(list(cache_dir.glob("*.json"))), 1)
+        self.assertEqual(
+            sorted(path.name for path in (output_dir / "models").iterdir()),
+            ["Product.py", "User.py", "__init__.py"],
+        )
+
+        user_file = output_dir / "models" / "User.py"
+        product_file = output_dir / "models" / "Product.py"
+        user_mtime = user_file.stat().st_mtime_ns
+        product_file.write_text("# hand-edited\n", encoding="utf-8")
+
+        schemas = dict(self.SCHEMAS)
+        schemas["User"] = {"type": "object", "properties": {"sku": {"type": "string"}}}
+        ModelGenerator(schemas, output_dir, cache_dir).generate_models()
+
+        # Changed schemas and modified files are regenerated
+        self.assertIn("def sku(self)", user_file.read_text(encoding="utf-8"))
+        self.assertIn("class Product(BaseModel):", product_file.read_text(encoding="utf-8"))
+        self.assertNotEqual(user_file.stat().st_mtime_ns, user_mtime)
+
+        # Untouched files with an unchanged schema are left alone
+        product_mtime = product_file.stat().st_mtime_ns
+        ModelGenerator(schemas, output_dir, cache_dir).generate_models()
+        self.assertEqual(product_file.stat().st_mtime_ns, product_mtime)
+
+        # Deleted files are regenerated even if the schema is unchanged
+        user_file.unlink()
+        ModelGenerator(schemas, output_dir, cache_dir).generate_models()
+        self.assertIn("class User(BaseModel):", user_file.read_text(encoding="utf-8"))
+
+    def test_no_cache_by_default(self):
+        """Test that without a cache dir every model is rewritten and nothing else is left."""
+        ModelGenerator(self.SCHEMAS, self.temp_dir).generate_models()
+        user_file = self.temp_dir / "models" / "User.py"
+        user_file.write_text("# hand-edited\n", encoding="utf-8")
+
+        ModelGenerator(self.SCHEMAS, self.temp_dir).generate_models()
+
+        self.assertIn("class User(BaseModel):", user_file.read_text(encoding="utf-8"))
+        self.assertEqual(sorted(path.name for path in self.temp_dir.iterdir()), ["base", "models"])
+
     def test_empty_schemas(self):
         """Test handling of empty schemas."""
         generator = ModelGenerator({}, self.temp_dir)
@@ -168,10 +251,7 @@ class TestModelGenerator(unittest.TestCase):
 
     def test_property_type_generation(self):
         """Test that property types are correctly generated."""
-        generator = ModelGenerator(self.schemas, self.temp_dir)
-        generator.generate_models()
-
-        user_file = self.temp_dir / "models" / "User.py"
+        user_file = self.generated_dir / "models" / "User.py"
         with open(user_file, "r", encoding="utf-8") as f:
             content = f.read()
 
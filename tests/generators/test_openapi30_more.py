@@ -46,6 +46,22 @@ def test_resolve_complex_schemas(tmp_path):
     assert gen._resolve_schema_type(s5) == "Any"
 
 
+def test_resolve_schema_type_cache(tmp_path):
+    gen = make_gen(tmp_path)
+    schema = {"const": "x"}
+
+    # const is only honoured from OpenAPI 3.1 on, so the family is part of the cache key
+    assert gen._resolve_schema_type(schema) == "Dict[str, Any]"
+    assert gen._resolve_schema_type(schema) == "Dict[str, Any]"
+    gen.version_info = {"version_family": "openapi31"}
+    assert gen._resolve_schema_type(schema) == "str"
+    assert len(gen._resolve_cache) == 2
+
+    # equal but distinct schema objects are resolved separately
+    assert gen._resolve_schema_type({"type": "integer"}) == "int"
+    assert len(gen._resolve_cache) == 3
+
+
 def test_get_request_body_info_priority(tmp_path):
     gen = make_gen(tmp_path)
     # requestBody with multiple content types - prefer application/json
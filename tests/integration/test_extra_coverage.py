@@ -1,31 +1,27 @@
-import json
 import pytest
 
 from openapi_client_generator.spec_loader import SpecLoader
 from openapi_client_generator.swagger20_api_generator import Swagger20APIGenerator
 from openapi_client_generator.openapi30_api_generator import OpenAPI30APIGenerator
-from openapi_client_generator.base_api_generator import BaseAPIGenerator
 
 
-def test_spec_loader_version_errors_and_normalization(tmp_path):
+def test_spec_loader_version_errors_and_normalization(spec_file_factory):
     # missing keys -> Invalid spec
-    f = tmp_path / "bad.json"
-    f.write_text(json.dumps({}))
     with pytest.raises(ValueError):
-        SpecLoader(str(f))
+        SpecLoader(spec_file_factory({}))
 
     # openapi short form '3.0' should normalize to 3.0.0
-    f2 = tmp_path / "o3.json"
-    f2.write_text(json.dumps({"openapi": "3.0", "info": {"title": "T", "version": "1.0.0"}}))
-    s = SpecLoader(str(f2))
+    s = SpecLoader(
+        spec_file_factory({"openapi": "3.0", "info": {"title": "T", "version": "1.0.0"}})
+    )
     vi = s.get_version_info()
     assert vi["version_family"].startswith("openapi")
 
     # unsupported version -> error
-    f3 = tmp_path / "o4.json"
-    f3.write_text(json.dumps({"openapi": "4.0.0", "info": {"title": "T", "version": "1.0.0"}}))
     with pytest.raises(ValueError):
-        SpecLoader(str(f3))
+        SpecLoader(
+            spec_file_factory({"openapi": "4.0.0", "info": {"title": "T", "version": "1.0.0"}})
+        )
 
 
 def test_swagger20_request_body_and_response_variants(tmp_path):
@@ -65,7 +61,7 @@ def test_swagger20_request_body_and_response_variants(tmp_path):
         },
     }
     info2 = gen._get_request_body_info(op2)
-    assert info2 and "List" in info2["type"]
+    assert info2 and info2["type"].startswith("List[")
 
     # response model with external ref -> None
     resp = gen._get_response_model({"responses": {"200": {"schema": {"$ref": "http://x"}}}})
@@ -92,24 +88,9 @@ def test_openapi30_unusual_refs_and_parameters(tmp_path):
     assert gen._get_parameter_type({}) == gen._resolve_schema_type({})
 
 
-def test_base_find_body_parameter():
-    class Dummy(BaseAPIGenerator):
-        def _get_request_body_info(self, operation):
-            return None
-
-        def _get_response_model(self, operation):
-            return None
-
-        def _get_content_types(self, operation):
-            return ([], [])
-
-    # use the tmp_path fixture as the output directory
-    import pathlib
-
-    out_dir = pathlib.Path(".")
-    d = Dummy({}, {}, "s", out_dir)
+def test_base_find_body_parameter(dummy_generator):
     # no body
-    assert d._find_body_parameter([]) is None
+    assert dummy_generator._find_body_parameter([]) is None
     # with body
     param = {"name": "body", "in": "body", "schema": {"type": "object"}}
-    assert d._find_body_parameter([param]) == param
+    assert dummy_generator._find_body_parameter([param]) == param
@@ -0,0 +1,154 @@
+"""
+Tests for the base_model module.
+"""
+
+import pytest
+
+from openapi_client_generator.base_model import BaseModel, FrozenBaseModel
+
+
+class CachedModel(BaseModel):
+    cache_serialization = True
+
+
+def test_to_dict_handles_nested_models_and_lists():
+    """Nested models and lists of models are converted to plain dicts."""
+    child = BaseModel({"id": 1})
+    model = BaseModel({"child": child, "items": [child, 2], "name": "x"})
+
+    assert model.to_dict() == {"child": {"id": 1}, "items": [{"id": 1}, 2], "name": "x"}
+
+
+def test_json_round_trip():
+    """to_json/from_json round-trip the underlying data."""
+    model = BaseModel({"id": 1, "tags": ["a", "b"]})
+
+    assert BaseModel.from_json(model.to_json()).to_dict() == {"id": 1, "tags": ["a", "b"]}
+
+
+def test_serialization_not_cached_by_default():
+    """Plain models reflect mutations of their data on every call."""
+    model = BaseModel({"id": 1})
+    model.to_json()
+    model._data["id"] = 2
+
+    assert model.to_dict() == {"id": 2}
+    assert BaseModel.from_json(model.to_json()).to_dict() == {"id": 2}
+
+
+def test_cache_serialization_memoizes_until_invalidated():
+    """Opted-in models reuse their JSON until invalidate() is called."""
+    model = CachedModel({"id": 1})
+    first_json = model.to_json()
+
+    assert model.to_json() is first_json
+
+    model._data["id"] = 2
+    model.invalidate()
+
+    assert model.to_dict() == {"id": 2}
+    assert CachedModel.from_json(model.to_json()).to_dict() == {"id": 2}
+
+
+def test_to_json_bytes_matches_to_json():
+    """to_json_bytes returns the UTF-8 encoding of the JSON document."""
+    model = BaseModel({"id": 1, "name": "café"})
+
+    assert isinstance(model.to_json_bytes(), bytes)
+    assert BaseModel.from_json(model.to_json_bytes().decode("utf-8")).to_dict() == model.to_dict()
+    assert bytes(model) == model.to_json_bytes()
+
+
+def test_flat_to_dict_returns_copy():
+    """Flat models return a copy that does not alias the model data."""
+    model = BaseModel({"id": 1})
+    result = model.to_dict()
+    result["id"] = 2
+
+    assert model.to_dict() == {"id": 1}
+
+
+def test_nested_values_added_later_are_converted():
+    """Plain models convert models inserted into their data without invalidate()."""
+    child = BaseModel({"id": 2})
+    model = BaseModel({"id": 1, "child": child})
+    model._data["other"] = BaseModel({"id": 3})
+    child._data["grandchild"] = BaseModel({"id": 4})
+
+    expected = {"id": 1, "child": {"id": 2, "grandchild": {"id": 4}}, "other": {"id": 3}}
+    assert model.to_dict() == expected
+    assert BaseModel.from_json(model.to_json()).to_dict() == expected
+
+
+def test_invalidate_picks_up_nested_values_added_later():
+    """Caching models convert models inserted into flat data after invalidate()."""
+    model = CachedModel({"id": 1})
+    model._data["child"] = BaseModel({"id": 2})
+    model.invalidate()
+
+    assert model.to_dict() == {"id": 1, "child": {"id": 2}}
+
+
+def test_deeply_nested_models_do_not_recurse():
+    """to_dict handles nesting deeper than the interpreter recursion limit."""
+    model = BaseModel({"id": 0})
+    for depth in range(1, 5000):
+        model = BaseModel({"id": depth, "child": model})
+
+    result = model.to_dict()
+    for _ in range(4999):
+        result = result["child"]
+
+    assert result == {"id": 0}
+
+
+def test_to_json_serializes_nested_models():
+    """to_json encodes nested models and lists of models without to_dict()."""
+    child = BaseModel({"id": 1})
+    model = BaseModel({"child": child, "items": [child, 2]})
+
+    assert BaseModel.from_json(model.to_json()).to_dict() == model.to_dict()
+
+
+def test_frozen_model_is_read_only_and_detached():
+    """Frozen models copy their input and reject mutation."""
+    data = {"id": 1}
+    model = FrozenBaseModel(data)
+    data["id"] = 2
+
+    assert model.to_dict() == {"id": 1}
+    with pytest.raises(TypeError):
+        model._data["id"] = 3
+
+
+def test_frozen_model_to_dict_is_not_shared():
+    """Changing a returned dict does not affect the model or later results."""
+    child = FrozenBaseModel({"id": 1})
+    model = FrozenBaseModel({"a": 1, "child": child})
+    result = model.to_dict()
+    result["a"] = 2
+    result["child"]["id"] = 2
+
+    assert model.to_dict() == {"a": 1, "child": {"id": 1}}
+    assert FrozenBaseModel.from_json(model.to_json()).to_dict() == {"a": 1, "child": {"id": 1}}
+
+
+def test_frozen_model_serializes_when_nested():
+    """Frozen models serialize on their own and as children of other models."""
+    child = FrozenBaseModel({"id": 1})
+    parent = BaseModel({"child": child, "items": [child]})
+
+    assert FrozenBaseModel.from_json(child.to_json()).to_dict() == {"id": 1}
+    assert child.to_json() is child.to_json()
+    assert BaseModel.from_json(parent.to_json()).to_dict() == {
+        "child": {"id": 1},
+        "items": [{"id": 1}],
+    }
+
+
+def test_from_json_bytes_round_trip():
+    """from_json_bytes parses encoded JSON without a separate decode step."""
+    model = BaseModel({"id": 1, "name": "café"})
+
+    assert BaseModel.from_json_bytes(model.to_json_bytes()).to_dict() == model.to_dict()
+    assert "café" in model.to_json()
@@ -1,109 +1,149 @@
-import json
+import re
+
 import pytest
 
 from openapi_client_generator.spec_loader import SpecLoader
 
-
-def write_spec(tmp_path, data, name="spec.json"):
-    p = tmp_path / name
-    p.write_text(json.dumps(data))
-    return str(p)
-
-
-def test_invalid_spec_missing_keys(tmp_path):
-    # Empty spec should raise
-    p = write_spec(tmp_path, {})
-    with pytest.raises(ValueError):
-        SpecLoader(p)
-
-
-def test_openapi_version_normalization_and_family(tmp_path):
-    # short form '3.0' should normalize to 3.0.0 and map to openapi3
-    spec = {"openapi": "3.0", "info": {"title": "t", "version": "1.0.0"}}
-    p = write_spec(tmp_path, spec, "o30.json")
-    s = SpecLoader(p)
-    vi = s.get_version_info()
-    assert vi["version_family"].startswith("openapi")
-
-    # 3.2.x should default to openapi32
-    spec2 = {"openapi": "3.2.1", "info": {"title": "t", "version": "1.0.0"}}
-    p2 = write_spec(tmp_path, spec2, "o321.json")
-    s2 = SpecLoader(p2)
-    assert s2.get_version_info()["version_family"] == "openapi32"
-
-
-def test_openapi_unsupported_version(tmp_path):
-    spec = {"openapi": "4.0.0", "info": {"title": "t", "version": "1.0.0"}}
-    p = write_spec(tmp_path, spec, "bad.json")
-    with pytest.raises(ValueError):
-        SpecLoader(p)
-
-
-def test_swagger_non_2_0_raises(tmp_path):
-    spec = {"swagger": "1.0", "info": {"title": "t", "version": "1.0.0"}}
-    p = write_spec(tmp_path, spec, "s1.json")
-    with pytest.raises(ValueError):
-        SpecLoader(p)
-
-
-def test_get_schemas_components_and_definitions(tmp_path):
-    openapi = {
-        "openapi": "3.0.0",
-        "info": {"title": "t", "version": "1.0.0"},
-        "components": {"schemas": {"A": {}}},
-    }
-    p1 = write_spec(tmp_path, openapi, "oa.json")
-    s1 = SpecLoader(p1)
-    assert "A" in s1.get_schemas()
-
-    swagger = {
-        "swagger": "2.0",
-        "info": {"title": "t", "version": "1.0.0"},
-        "definitions": {"B": {}},
-    }
-    p2 = write_spec(tmp_path, swagger, "sw.json")
-    s2 = SpecLoader(p2)
-    assert "B" in s2.get_schemas()
-
-
-def test_get_servers_and_base_path(tmp_path):
-    # swagger host -> servers conversion
-    swagger = {
-        "swagger": "2.0",
-        "host": "api.test",
-        "basePath": "/v1",
-        "schemes": ["http"],
-        "info": {"title": "t", "version": "1.0.0"},
-    }
-    p = write_spec(tmp_path, swagger, "sw2.json")
-    s = SpecLoader(p)
-    servers = s.get_servers()
-    assert any(d.get("url") == "http://api.test/v1" for d in servers)
-    assert s.get_base_path() == "/v1"
-
-    # openapi servers returned as-is and base_path empty
-    openapi = {
-        "openapi": "3.0.0",
-        "servers": [{"url": "https://x"}],
-        "info": {"title": "t", "version": "1.0.0"},
-    }
-    p2 = write_spec(tmp_path, openapi, "oa2.json")
-    s2 = SpecLoader(p2)
-    assert s2.get_servers() == [{"url": "https://x"}]
-    assert s2.get_base_path() == ""
-
-
-def test_version_info_flags(tmp_path):
-    o31 = {"openapi": "3.1.0", "info": {"title": "t", "version": "1.0.0"}}
-    p = write_spec(tmp_path, o31, "o31.json")
-    s = SpecLoader(p)
-    vi = s.get_version_info()
-    assert vi["supports_webhooks"] == "True"
-    assert vi["supports_json_schema_draft_2020_12"] == "True"
-
-    sw = {"swagger": "2.0", "info": {"title": "t", "version": "1.0.0"}}
-    p2 = write_spec(tmp_path, sw, "sw22.json")
-    s2 = SpecLoader(p2)
-    vi2 = s2.get_version_info()
-    assert vi2["is_swagger2"] == "True"
-    assert vi2["supports_webhooks"] == "False"
+# Keep the spec loading tests together on one xdist worker
+pytestmark = pytest.mark.xdist_group("spec_loader")
+
+_INFO = {"title": "t", "version": "1.0.0"}
+
+# Expected SpecLoader error messages, so unrelated ValueErrors do not pass the tests
+_MISSING_VERSION_RE = re.compile(r"missing 'openapi' or 'swagger' field")
+_UNSUPPORTED_VERSION_RE = re.compile(r"^Unsupported (OpenAPI|Swagger) version")
+
+# Fixture specs are static; they are passed to SpecLoader._from_mapping without a file
+_SPEC_EMPTY = {}
+_SPEC_O30_SHORT = {"openapi": "3.0", "info": _INFO}
+_SPEC_O321 = {"openapi": "3.2.1", "info": _INFO}
+_SPEC_O400 = {"openapi": "4.0.0", "info": _INFO}
+_SPEC_SW10 = {"swagger": "1.0", "info": _INFO}
+_SPEC_O30_SCHEMAS = {"openapi": "3.0.0", "info": _INFO, "components": {"schemas": {"A": {}}}}
+_SPEC_SW20_DEFINITIONS = {"swagger": "2.0", "info": _INFO, "definitions": {"B": {}}}
+_SPEC_SW20_HOST = {
+    "swagger": "2.0",
+    "host": "api.test",
+    "basePath": "/v1",
+    "schemes": ["http"],
+    "info": _INFO,
+}
+_SPEC_O30_SERVERS = {"openapi": "3.0.0", "servers": [{"url": "https://x"}], "info": _INFO}
+_SPEC_O31 = {"openapi": "3.1.0", "info": _INFO}
+_SPEC_SW20 = {"swagger": "2.0", "info": _INFO}
+
+
+@pytest.mark.parametrize(
+    "spec,error",
+    [
+        # Empty spec should raise
+        (_SPEC_EMPTY, _MISSING_VERSION_RE),
+        (_SPEC_O400, _UNSUPPORTED_VERSION_RE),
+        (_SPEC_SW10, _UNSUPPORTED_VERSION_RE),
+    ],
+    ids=["missing_keys", "openapi_unsupported", "swagger_non_2_0"],
+)
+def test_invalid_spec_raises(spec, error):
+    with pytest.raises(ValueError, match=error):
+        SpecLoader._from_mapping(spec)
+
+
+@pytest.mark.parametrize(
+    "spec,attr,expected",
+    [
+        # short form '3.0' should normalize to 3.0.0 and map to openapi3
+        (
+            _SPEC_O30_SHORT,
+            "get_version_info",
+            {
+                "exact_version": "3.0.0",
+                "version_family": "openapi3",
+                "is_swagger2": "False",
+                "is_openapi3": "True",
+                "is_openapi31": "False",
+                "is_openapi32": "False",
+                "supports_webhooks": "False",
+                "supports_json_schema_draft_2020_12": "False",
+                "supports_discriminator_mapping": "True",
+            },
+        ),
+        # 3.2.x should default to openapi32
+        (
+            _SPEC_O321,
+            "get_version_info",
+            {
+                "exact_version": "3.2.1",
+                "version_family": "openapi32",
+                "is_swagger2": "False",
+                "is_openapi3": "False",
+                "is_openapi31": "False",
+                "is_openapi32": "True",
+                "supports_webhooks": "True",
+                "supports_json_schema_draft_2020_12": "True",
+                "supports_discriminator_mapping": "True",
+            },
+        ),
+        (
+            _SPEC_O31,
+            "get_version_info",
+            {
+                "exact_version": "3.1.0",
+                "version_family": "openapi31",
+                "is_swagger2": "False",
+                "is_openapi3": "False",
+                "is_openapi31": "True",
+                "is_openapi32": "False",
+                "supports_webhooks": "True",
+                "supports_json_schema_draft_2020_12": "True",
+                "supports_discriminator_mapping": "True",
+            },
+        ),
+        (
+            _SPEC_SW20,
+            "get_version_info",
+            {
+                "exact_version": "2.0",
+                "version_family": "swagger2",
+                "is_swagger2": "True",
+                "is_openapi3": "False",
+                "is_openapi31": "False",
+                "is_openapi32": "False",
+                "supports_webhooks": "False",
+                "supports_json_schema_draft_2020_12": "False",
+                "supports_discriminator_mapping": "False",
+            },
+        ),
+        (_SPEC_O30_SCHEMAS, "get_schemas", {"A": {}}),
+        (_SPEC_SW20_DEFINITIONS, "get_schemas", {"B": {}}),
+        # swagger host -> servers conversion
+        (_SPEC_SW20_HOST, "get_servers", [{"url": "http://api.test/v1"}]),
+        (_SPEC_SW20_HOST, "get_base_path", "/v1"),
+        # openapi servers returned as-is and base_path empty
+        (_SPEC_O30_SERVERS, "get_servers", [{"url": "https://x"}]),
+        (_SPEC_O30_SERVERS, "get_base_path", ""),
+    ],
+    ids=[
+        "openapi_short_version",
+        "openapi32_default",
+        "openapi31_flags",
+        "swagger2_flags",
+        "components_schemas",
+        "swagger_definitions",
+        "swagger_servers",
+        "swagger_base_path",
+        "openapi_servers",
+        "openapi_base_path",
+    ],
+)
+def test_loaded_spec(spec, attr, expected):
+    loader = SpecLoader._from_mapping(spec)
+    assert getattr(loader, attr)() == expected
+
+
+def test_spec_values_outside_strict_json(spec_dir):
+    # NaN and integers beyond 64 bits load whichever JSON backend is installed
+    p = spec_dir / "nan.json"
+    p.write_bytes(b'{"openapi": "3.0.0", "x-min": NaN, "x-big": 123456789012345678901234567890}')
+    s = SpecLoader(str(p))
+    assert s.spec_data["x-big"] == 123456789012345678901234567890
+    assert s.spec_data["x-min"] != s.spec_data["x-min"]
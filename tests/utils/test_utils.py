@@ -32,6 +32,10 @@ def test_sanitize_python_identifier():
 
 def test_sanitize_model_name():
     """Test sanitizing model names."""
+    # Test names that are already valid
+    assert sanitize_model_name("User") == "User"
+    assert sanitize_model_name("Pet2") == "Pet2"
+
     # Test names with dots and spaces
     assert sanitize_model_name("User.Data") == "User_Data"
     assert sanitize_model_name("User Data") == "User_Data"
@@ -49,6 +53,10 @@ def test_sanitize_model_name():
     # Test trailing underscores
     assert sanitize_model_name("User_Model_") == "User_Model"
 
+    # Test leading underscores and non-ASCII identifiers
+    assert sanitize_model_name("_User") == "User"
+    assert sanitize_model_name("Über") == "ber"
+
 
 def test_to_snake_case():
     """Test converting strings to snake_case."""